@@ -45,7 +45,7 @@ setup(
         "Topic :: Software Development :: OpenAPI",
     ],
     keywords="rest restful api flask swagger openapi flask-restx server",
-    python_requires='>=3.5, <4',
+    python_requires='>=3.7, <4',
     external_packages=False,
     supplemental_packages=['swagtools_skeleton_client'] + SUPPLEMENTAL_PACKAGES,
     executables=([__file__, 'swagtools/app.py'] +
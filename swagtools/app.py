@@ -16,10 +16,6 @@ import signal
 from types import SimpleNamespace
 import time
 import threading
-if sys.version_info >= (3, 7):
-    OrderedDict = dict
-else:
-    from collections import OrderedDict
 
 from flask import (Flask, Blueprint, json)
 from flask_cors import CORS
@@ -103,9 +99,9 @@ def override_config(filespec, config_module=None):
     if not config_module:
         config_module = ServiceConfig
     config = vars(import_module_source('config', filespec, execute=True))  # (execute to resolve symbolic substitutions)
-    config = SimpleNamespace(**OrderedDict((('THISDIR', Path(filespec).resolve().parent),
-                                            *((k, v) for k, v in vars(config_module).items() if k not in config),
-                                            *config.items())))
+    config = SimpleNamespace(**dict((('THISDIR', Path(filespec).resolve().parent),
+                                     *((k, v) for k, v in vars(config_module).items() if k not in config),
+                                     *config.items())))
     config = apply_environ(config, environ={})
     for key, val in vars(config).items():
         if not key.startswith('__') and not hasattr(val, '__dict__'):
@@ -10,10 +10,6 @@ to all Flask-RESTX API resources.
 # pylint:disable=wrong-import-position,import-outside-toplevel
 import os
 import sys
-if sys.version_info < (3, 7):  # (pre-Python 3.7)
-    from collections import OrderedDict
-else:
-    OrderedDict = dict
 from http import HTTPStatus
 from base64 import (b64decode, b64encode)
 import uuid
@@ -68,7 +64,7 @@ def client_ipaddr(actual=False):
     """ Determines remote IPv4 address from which client submitted request, if applicable. """
     try:
         addrs = (flask_request.environ.get(sym) for sym in REAL_IP_HEADERS)
-        addr = ([addr for addr in addrs if addr] + [flask_request.remote_addr])[0]
+        addr = next((addr for addr in addrs if addr), flask_request.remote_addr)
     except RuntimeError:
         addr = None
     if actual and addr in ('localhost', '127.0.0.1'):
@@ -449,7 +445,7 @@ def define_api_resource(namespace, target=None, route=None, route_params=None,
     # For a base device class method, process method docstrings for its subclasses too.
     # pylint:disable=too-many-nested-blocks
     if callable(target):
-        docfuncs = OrderedDict(((None, target),))
+        docfuncs = {None: target}
         if doc_classes:
             basecls = getattr(sys.modules.get(target.__module__, object()), target.__qualname__.split('.')[0], None)
             if basecls:
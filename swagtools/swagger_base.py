@@ -11,14 +11,11 @@ and request processing utilities.
 import sys
 import re
 from types import SimpleNamespace
-if sys.version_info < (3, 7):  # (pre-Python 3.7)
-    from collections import OrderedDict
-else:
-    OrderedDict = dict
-from collections import namedtuple
+from collections import (namedtuple, OrderedDict)
 from contextlib import suppress
-from functools import partial
+from functools import (partial, lru_cache, wraps)
 from itertools import (compress, repeat)
+from operator import is_not
 from textwrap import dedent
 from string import Template
 from http import HTTPStatus
@@ -29,13 +26,18 @@ import inspect
 import traceback
 
 import introspection.typing.introspection as introspectyping
+try:
+    import orjson  # (optional: faster JSON serialization)
+except ImportError:
+    orjson = None
 
-from flask import (request as flask_request, url_for)
+from flask import (request as flask_request, url_for, make_response, current_app)
 from flask_restx import (Api, Resource, reqparse, fields, inputs)
 from flask_restx.namespace import Namespace
 from flask_restx.model import Model
 from flask_restx.utils import camel_to_dash
 import flask_restx.swagger
+from flask_restx.representations import output_json
 from werkzeug.datastructures import FileStorage
 import werkzeug.exceptions
 from werkzeug.exceptions import HTTPException
@@ -45,16 +47,17 @@ from werkzeug.serving import WSGIRequestHandler
 from cinch_pyutils.strings import (safe_eval, str_to_dict)
 # noinspection PyPackageRequirements,PyUnresolvedReferences
 from cinch_pyutils.containers import (OmniDict, dictify)
-# noinspection PyPackageRequirements,PyUnresolvedReferences
-from cinch_pyutils.iteration import feedback
+
+
+# pylint:disable=no-member
+_CODE_TO_STATUS = {int(e): e for e in HTTPStatus.__members__.values()}  # (reverse map: numeric code => HTTPStatus)
 
 
 # pylint:disable=invalid-name
 # noinspection PyPep8Naming
 def HTTPStatus_from_code(status_code):
     """ Performs reverse-lookup of the HTTPStatus enum value corresponding to a numeric status code. """
-    # pylint:disable=no-member
-    return ([e for e in HTTPStatus.__members__.values() if e == status_code] + [status_code])[0]
+    return _CODE_TO_STATUS.get(status_code, status_code)
 
 
 FlaskRESTXOptions = SimpleNamespace(
@@ -67,6 +70,12 @@ FlaskRESTXOptions = SimpleNamespace(
 RequestLocationGet = ('json', 'values')  # (location(s) for request parameters on GET requests)
 RequestLocationOther = ('json', 'values')  # (location(s) for request parameters on other HTTP methods)
 ResponseDesc = namedtuple('ResponseDesc', "status help type")
+# (request-invariant processing metadata for a request argument definition: see SwaggerResource.plan_args())
+ArgPlan = namedtuple('ArgPlan',
+                     "name argdef argtype locations body_arg json_arg model_arg dict_arg nullable "
+                     "model_opts model_class")
+# (request-invariant processing metadata for a request parser: see SwaggerResource.parser_plan())
+ParserPlan = namedtuple('ParserPlan', "args model_args positional positional_set json_fixup nargs")
 DefaultHTTPMethod = 'GET'  # pylint:disable=invalid-name
 
 
@@ -119,11 +128,224 @@ class Password(fields.String):  # noqa:E302
     __schema__ = dict(type='string', format='password')
 
 
+_FLASK_FIELDS_MODULE = fields.__name__
+_FLASK_FIELDS_SYMBOLS = frozenset(vars(fields))
+
+
+def json_response_body(data):
+    """
+    Serializes data as the body of a Flask-RESTX JSON response, using `orjson` where possible.
+
+    :param data: Data to serialize (plain JSON data, e.g., the Swagger specification)
+
+    :return: Serialized (JSON) data
+    :rtype:  bytes
+
+    .. note::
+     * Used only to serialize the Swagger specification (see SwaggerAPI.schema_json); all other responses are
+       serialized by Flask-RESTX as usual.  The `orjson` form is compact, i.e., differs from Python `json` output
+       in whitespace only.
+     * Falls back to the standard Flask-RESTX serialization (Python `json`) if `orjson` is not installed, in debug
+       mode (indented output), if custom JSON serialization settings are configured (RESTX_JSON), or if data contains
+       types `orjson` cannot serialize.
+    """
+    if orjson and not current_app.debug and not current_app.config.get('RESTX_JSON'):
+        with suppress(TypeError):
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS) + b'\n'
+    return output_json(data, HTTPStatus.OK).get_data()
+
+
+# (digit runs long enough to be an integer that `orjson` would decode differently from Python `json`, i.e., as float)
+_LONG_DIGITS_PATT = re.compile(r'\d{19}')
+_LONG_DIGITS_PATT_BYTES = re.compile(rb'\d{19}')
+
+
+def _orjson_decodable(data):
+    """ Internal utility: Determines whether `orjson` decodes JSON data exactly as Python `json` would. """
+    if isinstance(data, str):
+        return orjson and not _LONG_DIGITS_PATT.search(data)
+    return orjson and isinstance(data, (bytes, bytearray)) and not _LONG_DIGITS_PATT_BYTES.search(data)
+
+
+def json_loads(data):
+    """
+    Deserializes JSON data, using `orjson` where possible.
+
+    :param data: JSON data to deserialize
+    :type  data: Union(str, bytes)
+
+    :return: Deserialized data
+
+    .. note::
+     * Falls back to Python `json` if `orjson` is not installed, if data contains non-standard JSON that `orjson`
+       rejects (e.g., NaN), or if data contains integers too long for `orjson` to represent exactly.
+    """
+    if _orjson_decodable(data):
+        with suppress(ValueError):
+            return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_str_to_dict(value):
+    """
+    Converts a dictionary representation to a dictionary, parsing JSON objects directly via `orjson` where possible.
+
+    :param value: Dictionary, or string representation thereof (JSON or Python syntax)
+    :type  value: Union(dict, str)
+
+    :return: Dictionary represented
+    :rtype:  dict
+
+    .. note::
+     * Anything other than a valid JSON object (e.g., Python dict syntax) is converted via `str_to_dict()`, as is
+       a JSON object containing integers too long for `orjson` to represent exactly.
+    """
+    if isinstance(value, str) and value.lstrip().startswith('{') and _orjson_decodable(value):
+        with suppress(ValueError):
+            result = orjson.loads(value)
+            if isinstance(result, dict):
+                return result
+    return str_to_dict(value)
+
+
+def _sanitize_container(item):
+    """ Internal utility: Represents a (possibly) container item in JSONifiable form, else as a string. """
+    if isinstance(item, dict):
+        return _sanitize_encode(item)
+    if isinstance(item, (list, tuple)):
+        return [_sanitize_encode(e) for e in item]
+    return str(item)
+
+
+def _sanitize_via_encoder(item):
+    """ Internal utility: Represents an item via its custom encoder. """
+    return item.__encoder__(item)
+
+
+def _sanitize_via_vars(item):
+    """ Internal utility: Represents an item via its attribute dictionary (or its own custom encoder, if any). """
+    attrs = vars(item)
+    encoder = attrs.get('__encoder__')
+    return _sanitize_container(attrs) if encoder is None else encoder(item)
+
+
+def _sanitize_via_attrs(item):
+    """ Internal utility: Represents an item whose attributes are resolved dynamically (by instance). """
+    if hasattr(item, '__encoder__'):
+        return _sanitize_via_encoder(item)
+    if hasattr(item, '__dict__'):
+        return _sanitize_container(vars(item))
+    return _sanitize_container(item)
+
+
+_SANITIZE_STRATEGIES = {}  # (memoized representation strategy for non-JSON-serializable items, per type)
+_SANITIZE_STRATEGIES_MAX = 1024  # (limit on types memoized, lest dynamically-created types accumulate)
+
+
+def _sanitize_default(item):
+    """
+    Internal utility: Represents a non-JSON-serializable item in JSONifiable form (see `sanitize_for_json()`).
+
+    .. note::
+     * The representation strategy (custom `__encoder__`, attribute dictionary, or container/string) is determined
+       once per item type, from the type alone: a class-level `__encoder__`, else instance attribute dictionaries
+       (where an instance-level `__encoder__` is honored per instance); types that resolve attributes dynamically
+       (`__getattr__`) are inspected per instance.
+    """
+    itemtype = type(item)
+    strategy = _SANITIZE_STRATEGIES.get(itemtype)
+    if strategy is None:
+        if hasattr(itemtype, '__getattr__'):
+            strategy = _sanitize_via_attrs
+        elif hasattr(itemtype, '__encoder__'):
+            strategy = _sanitize_via_encoder
+        elif itemtype.__dictoffset__:  # (instances have attribute dictionaries)
+            strategy = _sanitize_via_vars
+        else:
+            strategy = _sanitize_container
+        if len(_SANITIZE_STRATEGIES) < _SANITIZE_STRATEGIES_MAX:
+            _SANITIZE_STRATEGIES[itemtype] = strategy
+    return strategy(item)
+
+
+class _SanitizeEncoder(json.JSONEncoder):
+    """ Internal JSON encoder: Represents non-JSON-serializable items via `_sanitize_default()`. """
+    def default(self, item):  # pylint:disable=arguments-renamed
+        return _sanitize_default(item)  # (base class only raises TypeError: bypassed)
+
+
+_JSON_SCALARS = (str, int, float)
+_JSON_KEY_CONSTANTS = {True: 'true', False: 'false', None: 'null'}
+
+
+def _sanitize_key(key):
+    """ Internal utility: Converts a dictionary key as Python `json` would represent it (as a string). """
+    if isinstance(key, str):
+        return key if type(key) is str else str.__str__(key)
+    if key is None or isinstance(key, bool):
+        return _JSON_KEY_CONSTANTS[key]
+    if isinstance(key, int):
+        return int.__repr__(key)
+    if isinstance(key, float):
+        return json.dumps(float.__float__(key))
+    raise TypeError(f"keys must be str, int, float, bool or None, not {type(key).__name__}")
+
+
+def _sanitize_walk(obj):
+    """
+    Internal utility: Converts an object to JSONifiable form directly, equivalently to a Python `json` round trip.
+
+    .. note::
+     * Subclasses of JSON-native types are reduced to their base type, as JSON serialization would represent them.
+    """
+    objtype = type(obj)
+    if objtype in _JSON_SCALARS or obj is None or objtype is bool:
+        return obj
+    if isinstance(obj, dict):
+        return {_sanitize_key(k): _sanitize_walk(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_sanitize_walk(e) for e in obj]
+    if isinstance(obj, str):
+        return str.__str__(obj)
+    if isinstance(obj, int):
+        return int.__int__(obj)
+    if isinstance(obj, float):
+        return float.__float__(obj)
+    return _sanitize_walk(_sanitize_default(obj))
+
+
+def _sanitize_encode(obj, load=True):
+    """ Internal utility: Converts an object to JSONifiable form (or its JSONification, if not `load`). """
+    if not load:
+        return json.dumps(dictify(obj), cls=_SanitizeEncoder)
+    return _sanitize_walk(dictify(obj))
+
+
+def _memoize_type_predicate(func):  # noqa:E302
+    """
+    Internal decorator: Memoizes a single-argument type predicate; unhashable arguments are evaluated directly.
+
+    .. note::
+     * Types are immutable, so a predicate's result for a type object is invariant.
+    """
+    cached = lru_cache(maxsize=1024)(func)
+
+    @wraps(func)
+    def wrapper(obj):
+        try:
+            return cached(obj)
+        except TypeError:  # (unhashable)
+            return func(obj)
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
 def is_basic_type(obj):  # noqa:E302
     """ Determines whether an object is a non-parameterized non-generic Python type. """
     return isinstance(obj, type)
 
 if sys.version_info < (3, 9):  # noqa:E305 # (pre-Python 3.9)
+    @_memoize_type_predicate
     def is_generic_type(obj):
         """ Determines whether an object is a Python generic type as defined within the 'typing' module. """
         return introspectyping.is_typing_type(obj)
@@ -139,19 +361,40 @@ else:
         # noinspection PyUnresolvedReferences,PyProtectedMember
         return isinstance(obj, (typing.GenericAlias, typing._GenericAlias, typing._Final))
 
-def is_type(obj):  # noqa:E302
+@_memoize_type_predicate  # noqa:E302
+def is_type(obj):
     """ Determines whether an object is any kind of type. """
     # return is_basic_type(obj) or is_generic_type(obj)
     return introspectyping.is_type(obj, allow_forwardref=False) and obj is not None
 
 def is_field_type(obj):  # noqa:E302
     """ Determines whether an object is a Flask-RESTX 'fields' type or object thereof. """
-    return any(cls.__module__ == 'flask_restx.fields' for cls in (obj,) + obj.__class__.__mro__)
+    return getattr(obj, '__module__', None) == _FLASK_FIELDS_MODULE or _has_field_base(obj.__class__)
+
+@lru_cache(maxsize=256)  # noqa:E302
+def _has_field_base(cls):
+    """ Internal utility: Determines whether a class derives from any Flask-RESTX 'fields' class. """
+    return any(base.__module__ == _FLASK_FIELDS_MODULE for base in cls.__mro__)
 
 def is_model(obj):  # noqa:E302
     """ Determines whether an object refers to a resolved Swagger model defined in the Swagger API. """
     return isinstance(obj, Model)
 
+@lru_cache(maxsize=4096)  # noqa:E302
+def _unwrapped(func):
+    """ Internal utility: Retrieves the innermost function wrapped by any decorator(s) applied to a function. """
+    return inspect.unwrap(func)
+
+
+# noinspection PyUnresolvedReferences
+_TYPING_SYMBOLS = {**vars(typing), **__builtins__}  # (evaluation namespace for type specification strings)
+# noinspection PyUnresolvedReferences
+_BUILTIN_TYPES = frozenset(v for v in __builtins__.values() if isinstance(v, type))
+_TYPESPEC_CACHE = OrderedDict()  # (memoized type specification resolutions: typespec => (type, names referenced))
+_TYPESPEC_CACHE_MAX = 1024  # (limit on type specifications memoized, least recently used discarded)
+_IDENTIFIER_PATT = re.compile(r'[A-Za-z_]\w*')
+_BRACKET_TRANS = str.maketrans('(<)>', '[[]]')  # (legacy composite type delimiters => subscript brackets)
+
 
 class TypingJig:
     """ Utilities for type conversion of model fields, request parameter types, and response return values.  """
@@ -206,6 +449,11 @@ class TypingJig:
         'ItemsView': typing.Dict,
     }
 
+    # Interned field instances: (field class, field definition items) => field instance.
+    FIELD_INSTANCES = {}
+
+    MODULE_SYMBOLS = None  # (type specification evaluation namespace, sans model types: set at end of module)
+
     class TypeResolutionError(Exception):  # noqa:E302
         """ Failure to resolve type. """
 
@@ -217,26 +465,102 @@ class TypingJig:
         """ Retrieve 'typing' typename of a generic type (independent of Python version).  """
         return getattr(generic_type, '__name__', type(generic_type).__name__.lstrip('_'))
 
+    @classmethod
+    def field_instance(cls, fldclass, **flddef):
+        """
+        Creates a Flask-RESTX field object, reusing any identical one already created.
+
+        :param fldclass: Flask-RESTX field type
+        :type  fldclass: type
+        :param flddef:   Field definition attributes (constructor arguments)
+
+        :return: Field object
+        :rtype:  flask_restx.fields.Raw
+
+        .. note::
+         * Field objects are not modified once constructed, so identically-defined fields are shareable among models.
+         * Field definitions that include unhashable values (e.g., models, lists) are not interned.
+        """
+        try:
+            key = (fldclass, frozenset((k, type(v), v) for k, v in flddef.items()))
+            fldobj = cls.FIELD_INSTANCES.get(key)
+        except TypeError:
+            return fldclass(**flddef)
+        if fldobj is None:
+            fldobj = cls.FIELD_INSTANCES[key] = fldclass(**flddef)
+        return fldobj
+
     @staticmethod
-    def to_type(typespec, **symbols):  # noqa:E302
+    def to_type(typespec, _symbols=None, **symbols):  # noqa:E302
         """
         Translates a native or composite type specification string ala 'typing' module into a built-in or 'typing'
         expression.
 
         :param typespec: Type specification string or 'typing' annotation string or any composite
         :type  typespec: Union(str, type)
+        :param _symbols: Complete evaluation namespace for type specification, including 'typing' and built-in names
+                         (e.g., from `symbols()`), used as-is (None => 'typing' and built-in names); overridden by
+                         `symbols`
+        :type  _symbols: Union(dict, None)
 
         :return: Canonical form for type (None => type specification does not resolve to a type)
         :rtype:  Union(type, None)
 
         .. note::
          * Supports legacy composite type descriptors such as 'list<int>'.
+         * Resolutions of type specification strings referencing only 'typing'/built-in names are memoized (for the
+           most recently used ones), and reused whenever none of those names is rebound by the namespace.
         """
+        overrides = symbols
+        if _symbols is not None:
+            overrides = {**_symbols, **symbols} if symbols else _symbols
+        cache_key = None
         if isinstance(typespec, str):
-            typespec = re.sub(r'[(<]', '[', re.sub(r'[)>]', ']', typespec))
+            with suppress(KeyError):
+                resolved, deps = _TYPESPEC_CACHE[typespec]
+                if all(overrides.get(name, obj) is obj for name, obj in deps):
+                    _TYPESPEC_CACHE.move_to_end(typespec)
+                    return resolved
+            cache_key = typespec
+            typespec = typespec.translate(_BRACKET_TRANS)
+            names = set(_IDENTIFIER_PATT.findall(typespec))
+        namespace = overrides if _symbols is not None else {**_TYPING_SYMBOLS, **symbols}
         with suppress(Exception):
-            typespec = safe_eval(typespec, symbols={**vars(typing), **__builtins__, **symbols})
-        return typespec if is_type(typespec) else None
+            typespec = safe_eval(typespec, symbols=namespace)
+        resolved = typespec if is_type(typespec) else None
+        # noinspection PyUnboundLocalVariable
+        if cache_key is not None and names <= _TYPING_SYMBOLS.keys():
+            deps = tuple((name, _TYPING_SYMBOLS[name]) for name in names)
+            if all(overrides.get(name, obj) is obj for name, obj in deps):
+                _TYPESPEC_CACHE[cache_key] = (resolved, deps)
+                if len(_TYPESPEC_CACHE) > _TYPESPEC_CACHE_MAX:
+                    with suppress(KeyError):
+                        _TYPESPEC_CACHE.popitem(last=False)
+        return resolved
+
+    @classmethod
+    def symbols(cls, api=None):
+        """
+        Retrieves the evaluation namespace for type specification strings: 'typing', built-in, and global names here,
+        plus the model types defined within an API.
+
+        :param api: Global Flask-RESTX API within which to access any Swagger model types (None => no model types)
+        :type  api: Union(SwaggerAPI, None)
+
+        :return: Evaluation namespace (not to be modified)
+        :rtype:  dict
+
+        .. note::
+         * Namespaces are cached (per API), and invalidated as models are defined (see SwaggerModel.define()).
+         * The global names here are those defined once this module is imported (frozen thereafter): names added to
+           this module later are not included, so types to be referenced by name should be defined as models.
+        """
+        if api is None:
+            return cls.MODULE_SYMBOLS
+        namespace = getattr(api, 'symbol_cache', None)
+        if namespace is None:
+            namespace = api.symbol_cache = {**cls.MODULE_SYMBOLS, **api.model_types}
+        return namespace
 
     @staticmethod
     def get_parameterized_type(native_type):
@@ -259,7 +583,7 @@ class TypingJig:
 
     # pylint:disable=too-many-nested-blocks
     @classmethod
-    def generic_to_field(cls, api, fldname, typing_type, **kwargs):
+    def generic_to_field(cls, api, fldname, typing_type, _depth=0, **kwargs):
         """
         Converts a 'typing' package type specification into a Flask-RESTX field type object.
 
@@ -269,24 +593,27 @@ class TypingJig:
         :type  fldname:     str
         :param typing_type: Python native type or generic 'typing' package type to decompose/convert
         :type  typing_type: type
+        :param _depth:      Recursion depth of enclosing conversion (internal use)
+        :type  _depth:      int
         :param kwargs:      Model/request definition attributes to propagate, if any
 
         :return: Flask-RESTX 'fields' type instance (None => could not resolve type into a field)
         :rtype:  object
         """
         fldtype = typing_type
-        depth = kwargs['_depth'] = kwargs.setdefault('_depth', 0) + 1
+        depth = _depth + 1
         if depth > kwargs.get('max_depth', 10):
             raise cls.RecursionError(f"for '{fldname}' ({fldtype})")
         if not is_generic_type(fldtype):
             substype = cls.TYPE_TO_GENERIC.get(fldtype.__name__)
             if substype:
                 fldtype = substype
-            fldtype = cls.field_def_to_field(api, fldname, dict(type=fldtype), **kwargs)
+            fldtype = cls.field_def_to_field(api, fldname, dict(type=fldtype),
+                                             _depth=depth, **kwargs)
         else:
             base, args = cls.get_parameterized_type(typing_type)
             if base == typing.Any:  # pylint:disable=comparison-with-callable
-                fldtype = DefaultField(**kwargs)
+                fldtype = cls.field_instance(DefaultField, **kwargs)
             else:
                 fldtype = None
                 base = cls.TYPE_TO_GENERIC.get(cls.get_typename(base), base)
@@ -300,23 +627,25 @@ class TypingJig:
                     else:
                         unargs = []
                         for arg in args:
-                            arg = cls.generic_to_field(api, fldname, arg, **kwargs)
+                            arg = cls.generic_to_field(api, fldname, arg, _depth=depth, **kwargs)
                             if type(arg) not in [type(t) for t in unargs]:
                                 unargs.append(arg)
-                        fldtype = DefaultField(x_alternatives=tuple(unargs), **kwargs)
+                        fldtype = cls.field_instance(DefaultField, x_alternatives=tuple(unargs), **kwargs)
                 if not fldtype:
                     if base == typing.Optional:  # pylint:disable=comparison-with-callable
                         kwargs.update(dict(required=False, default=None))
-                        fldtype = cls.generic_to_field(api, fldname, args[0], **kwargs)
+                        fldtype = cls.generic_to_field(api, fldname, args[0], _depth=depth, **kwargs)
                     elif base == typing.List:
-                        elem_type = cls.generic_to_field(api, fldname, args[0], **kwargs) if args else DefaultField
-                        fldtype = fields.List(elem_type, **kwargs)
+                        elem_type = (cls.generic_to_field(api, fldname, args[0],
+                                                          _depth=depth, **kwargs)
+                                     if args else DefaultField)
+                        fldtype = cls.field_instance(fields.List, cls_or_instance=elem_type, **kwargs)
                     elif issubclass(base, typing.Dict):
-                        fldtype = DefaultField(**kwargs)
+                        fldtype = cls.field_instance(DefaultField, **kwargs)
         return fldtype
 
     @classmethod
-    def field_def_to_field(cls, api, fldname, flddef, nest_model=True, **kwargs):
+    def field_def_to_field(cls, api, fldname, flddef, nest_model=True, _depth=0, **kwargs):
         """
         Creates a Flask-RESTX field type object from a model field or input parameter description dictionary.
 
@@ -328,12 +657,17 @@ class TypingJig:
         :type  flddef:     dict
         :param nest_model: "When processing a model type, enclose it within a 'NestedField' object."
         :type  nest_model: bool
+        :param _depth:     Recursion depth of enclosing type conversion (internal use)
+        :type  _depth:     int
         :param kwargs:     Supplemental/overriding model/request definition attributes for model/parameter field
 
         :return: Flask-RESTX 'fields' type instance (None => could not resolve type into a field)
         :rtype:  object
+
+        .. note::
+         * `flddef` is not modified.
         """
-        flddef.update(kwargs)
+        flddef = {**flddef, **kwargs}
         typespec = flddef.get('type', DefaultField)
         fldtype = cls.typespec_to_type(api, typespec)
         if is_model(SwaggerModel.get(api, fldtype)) and nest_model:
@@ -342,11 +676,40 @@ class TypingJig:
         elif is_basic_type(fldtype):
             fldtype = cls.TYPE_TO_FIELD.get(fldtype.__name__, fldtype)
             if is_field_type(fldtype):
-                fldtype = fldtype(**flddef)
+                fldtype = cls.field_instance(fldtype, **flddef)
         if not fldtype:
-            fldtype = cls.to_type(typespec, **{**globals(), **api.model_types})
+            fldtype = cls.to_type(typespec, _symbols=cls.symbols(api))
         if fldtype and is_type(fldtype) and not is_field_type(fldtype):
-            fldtype = cls.generic_to_field(api, fldname, fldtype, **kwargs)
+            fldtype = cls.generic_to_field(api, fldname, fldtype, _depth=_depth, **kwargs)
+        return fldtype
+
+    @classmethod
+    def result_field(cls, api, typespec):
+        """
+        Creates a Flask-RESTX field type object for an endpoint result (i.e., non-nested) type specification.
+
+        :param api:      Global Flask-RESTX API within which to access any Swagger models/types referenced
+        :type  api:      flask_restx.Api
+        :param typespec: Result type specification
+        :type  typespec: Union(type, str)
+
+        :return: Flask-RESTX 'fields' type instance (None => could not resolve type into a field)
+        :rtype:  object
+
+        .. note::
+         * Resolved fields are cached (per API), and invalidated as models are defined (see SwaggerModel.define()).
+        """
+        cache = getattr(api, 'result_field_cache', None)
+        if cache is None:
+            cache = api.result_field_cache = {}
+        try:
+            fldtype = cache.get(typespec)
+        except TypeError:  # (unhashable type specification: no caching)
+            return cls.field_def_to_field(api, '<result>', dict(type=typespec), nest_model=False)
+        if fldtype is None:
+            fldtype = cls.field_def_to_field(api, '<result>', dict(type=typespec), nest_model=False)
+            if fldtype:
+                cache[typespec] = fldtype
         return fldtype
 
     @classmethod
@@ -373,10 +736,9 @@ class TypingJig:
             typeval = __builtins__.get(typespec, typespec)
             if is_basic_type(typeval):
                 if issubclass(typeval, Enum):
-                    # noinspection PyUnresolvedReferences
-                    typeval = [t for t in typeval.__mro__ if t in __builtins__.values()][0]
+                    typeval = next((t for t in typeval.__mro__ if t in _BUILTIN_TYPES), typeval)
             else:
-                typeval = cls.to_type(typeval, **globals())
+                typeval = cls.to_type(typeval, _symbols=cls.symbols())
         return typeval
 
     @classmethod
@@ -407,6 +769,37 @@ class TypingJig:
 
     class FieldConverter:
         """ Internal helper class to support dynamic data conversions for supported Swagger field types. """
+        CONVERTERS = {}  # (memoized converters: (generic typename, type arguments) => converter)
+
+        # Mapping from Python types to input converters for types not convertible by the type constructor itself.
+        INPUT_CONVERTERS = {
+            bool: inputs.boolean,
+            dict: json_str_to_dict,
+        }
+
+        @classmethod
+        def memoized(cls, key, factory):
+            """
+            Retrieves the converter memoized for a generic type specification, creating it on first use.
+
+            :param key:     Generic typename and type argument(s) that determine the converter
+            :type  key:     tuple
+            :param factory: Converter constructor (no-argument callable)
+            :type  factory: Callable
+
+            :return: Converter function
+            :rtype:  Callable
+
+            .. note::
+             * Converters for type arguments that cannot be hashed (e.g., models) are created anew each time.
+            """
+            try:
+                converter = cls.CONVERTERS.get(key)
+            except TypeError:
+                return factory()
+            if converter is None:
+                converter = cls.CONVERTERS[key] = factory()
+            return converter
 
         # pylint:disable=invalid-name,possibly-unused-variable
         # noinspection PyPep8Naming,PyUnusedLocal
@@ -428,32 +821,48 @@ class TypingJig:
             if len(typelist) == 1:  # (single-type Union: no Union at all, just a simple type)
                 union_type = typelist[0]
             else:  # (type Union: create a type class to encapsulate the polymorphic type)
-                # pylint:disable=invalid-name
-                def converter(value, schema=None):
-                    alternatives = ()
+                union_type = cls.memoized(('Union', typelist), partial(cls.union_converter, typelist))
+            return union_type
+
+        @classmethod
+        def union_converter(cls, typelist):
+            """
+            Creates a converter for a multiple-type Union.
+
+            .. note::
+             * Input converters for the alternative types are resolved here once, except for those that depend upon
+               the value being converted (list-like types), which are resolved per value.
+            """
+            value_dependent = (tuple, list, typing.Iterable)
+            converters = tuple(None if cvtr in value_dependent else cls.input_converter(cvtr) for cvtr in typelist)
+
+            # pylint:disable=invalid-name
+            def converter(value, schema=None):
+                alternatives = ()
+                try:
+                    alternatives = schema.get('x_alternatives', alternatives)
                     try:
-                        alternatives = schema.get('x_alternatives', alternatives)
+                        pyvalue = safe_eval(value)
+                    except (Exception, BaseException):
+                        pyvalue = value
+                    chain = converters if alternatives is typelist else repeat(None, len(alternatives))
+                    for cvtr, convert in zip(alternatives, chain):
                         try:
-                            pyvalue = safe_eval(value)
+                            convert = convert or cls.input_converter(cvtr, other_types=alternatives, value=pyvalue)
+                            value = convert(pyvalue)
+                            break
                         except (Exception, BaseException):
-                            pyvalue = value
-                        for cvtr in alternatives:
-                            try:
-                                value = cls.input_converter(cvtr, other_types=alternatives, value=pyvalue)(pyvalue)
-                                break
-                            except (Exception, BaseException):
-                                pass
-                        else:
-                            value = NotImplemented
-                        ok = value is not NotImplemented
-                    except (Exception, BaseException):
-                        ok = str in alternatives
-                    if not ok:
-                        raise ValueError(f"Must be convertible to one of: {alternatives}")
-                    return value
+                            pass
+                    else:
+                        value = NotImplemented
+                    ok = value is not NotImplemented
+                except (Exception, BaseException):
+                    ok = str in alternatives
+                if not ok:
+                    raise ValueError(f"Must be convertible to one of: {alternatives}")
+                return value
 
-                union_type = partial(converter, schema=dict(x_alternatives=typelist))
-            return union_type
+            return partial(converter, schema=dict(x_alternatives=typelist))
 
         # pylint:disable=invalid-name,possibly-unused-variable
         # noinspection PyPep8Naming,PyUnusedLocal
@@ -472,27 +881,29 @@ class TypingJig:
             .. note::
              * The subordinate type specification for list items must be evaluable or defined ala 'typing' module.
             """
-            def converter(value, schema=None):
-                itemstype = str
-                try:
-                    itemstype = schema.get('x_itemstype', itemstype)
-                    if isinstance(value, str):
-                        try:
-                            value = safe_eval(value)
-                        except (BaseException, Exception):
-                            if itemstype != str:
-                                raise
-                            value = [v.strip() for v in value.split(',')]
-                    ok = (isinstance(value, typing.Sequence) and
-                          all(elem is None or isinstance(elem, itemstype) for elem in value))
-                except (Exception, BaseException):
-                    ok = False
-                if not ok:
-                    raise ValueError(f"List items must be of type {itemstype}")
-                return list(value)
-
             args = args[0] if len(args) == 1 else None
-            return partial(converter, schema=dict(x_itemstype=args))
+            return cls.memoized(('List', args), lambda: partial(cls.list_converter, schema=dict(x_itemstype=args)))
+
+        @staticmethod
+        def list_converter(value, schema=None):
+            """ Converts a list-of-type value, validating the type of its items (per 'x_itemstype' in `schema`). """
+            itemstype = str
+            try:
+                itemstype = schema.get('x_itemstype', itemstype)
+                if isinstance(value, str):
+                    try:
+                        value = safe_eval(value)
+                    except (BaseException, Exception):
+                        if itemstype != str:
+                            raise
+                        value = [v.strip() for v in value.split(',')]
+                ok = (isinstance(value, typing.Sequence) and  # (null elements permitted; rest checked in C loop)
+                      all(map(isinstance, filter(partial(is_not, None), value), repeat(itemstype))))
+            except (Exception, BaseException):
+                ok = False
+            if not ok:
+                raise ValueError(f"List items must be of type {itemstype}")
+            return list(value)
 
         # pylint:disable=invalid-name,possibly-unused-variable
         # noinspection PyPep8Naming
@@ -516,36 +927,45 @@ class TypingJig:
             :return: Converter function for parameter value transmutation
             :rtype:  Callable
             """
-            if typeval is bool:
-                typeval = inputs.boolean
-            elif typeval is dict:
-                typeval = str_to_dict
-            elif typeval in (tuple, list, typing.Iterable):
+            with suppress(TypeError):  # (unhashable type specifier, e.g., model)
+                converter = cls.INPUT_CONVERTERS.get(typeval)
+                if converter:
+                    return converter
+            if typeval in (tuple, list, typing.Iterable):
                 if isinstance(value, str) and ',' not in value:
-                    if str in other_types:
-                        typeval = str
-                    else:
-                        typeval = lambda s: safe_eval(f"[{s}]")  # noqa:E731
+                    typeval = str if str in other_types else cls.eval_as_list
             return typeval
 
+        @staticmethod
+        def eval_as_list(value):
+            """ Converts a string representing the contents of a list literal into a list. """
+            return safe_eval(f"[{value}]")
+
 
 class SwaggerNamespace(Namespace):
     """ Wrapper class for Flask-RESTX :class:`Namespace` to allow customization overrides. """
+    STATUS_PREFIX = 'HTTPStatus.'
+
     def __init__(self, *args, **kwargs):
         kwargs.setdefault('ordered', True)
         super().__init__(*args, **kwargs)
 
     @staticmethod
+    @lru_cache(maxsize=128)
     def canonical_status_code(code):
         """ Represents HTTP status code as unprefixed symbolic HTTP status string. """
         with suppress(Exception):
             code = HTTPStatus(int(code))
-        return str(code).split('HTTPStatus.', maxsplit=1)[-1]
+        code, prefix, suffix = str(code).partition(SwaggerNamespace.STATUS_PREFIX)
+        return suffix if prefix else code
 
     def response(self, code, description, model=None, **kwargs):
         """ Normalize HTTP response codes to be symbolic rather than numeric in the Swagger UI. """
+        symbolic = isinstance(code, str) and self.STATUS_PREFIX not in code and not any(map(str.isdigit, code))
+        if not symbolic:
+            code = self.canonical_status_code(code)
         # noinspection PyTypeChecker
-        return super().response(self.canonical_status_code(code), description, model=model, **kwargs)
+        return super().response(code, description, model=model, **kwargs)
 
 
 class SwaggerAPI(Api):
@@ -558,6 +978,11 @@ class SwaggerAPI(Api):
         if logger:
             self.log = logger
         self.model_types = {}
+        self.symbol_cache = None  # (type specification evaluation namespace for API: see TypingJig.symbols())
+        self.result_field_cache = None  # (resolved endpoint result fields for API: see TypingJig.result_field())
+        self.model_lookup_cache = None  # (resolved models for type specifications: see SwaggerModel.lookup())
+        self._schema_json = None  # (Swagger specification and its serialized form, once serialized)
+        self.representations['application/json'] = self.output_json
 
         # Override Flask-RESTX :class:`Swagger` with a custom class, to permit supplemental processing.
         # noinspection PyUnresolvedReferences,PyPep8Naming
@@ -570,6 +995,36 @@ class SwaggerAPI(Api):
         SwaggerWrapper.SWAGGER_NUMERIC_STATUS_CODES = getattr(self, 'SWAGGER_NUMERIC_STATUS_CODES', False)
         return super().__schema__
 
+    def invalidate_schema(self):
+        """
+        Discards the Swagger specification generated for the API (and its serialized form), so that it is regenerated
+        upon next access (e.g., after resources or models are added dynamically).
+
+        .. note::
+         * Flask-RESTX generates the Swagger specification only once, upon first access.
+        """
+        self._schema = None
+        self._schema_json = None
+
+    @property
+    def schema_json(self):
+        """ Serialized (JSON) form of the Swagger specification, serialized only once per generated specification. """
+        schema = self.__schema__
+        if not self._schema_json or self._schema_json[0] is not schema:
+            self._schema_json = (schema, json_response_body(schema))
+        return self._schema_json[1]
+
+    def output_json(self, data, code, headers=None):
+        """
+        Flask-RESTX JSON representation: Makes a Flask response with a JSON-encoded body, serving the Swagger
+        specification from its cached serialized form (all else as per standard Flask-RESTX).
+        """
+        if data is None or data is not self._schema:
+            return output_json(data, code, headers)
+        response = make_response(self.schema_json, code)
+        response.headers.extend(headers or {})
+        return response
+
     @property
     def specs_url(self):
         """
@@ -619,6 +1074,7 @@ class SwaggerModel:
         """
         model = api.model(typename, SwaggerModel.to_dict(api, flddefs))
         api.model_types[typename] = globals().get(typename, type(typename, (), dict(__fields__=model)))
+        api.symbol_cache = api.result_field_cache = api.model_lookup_cache = None  # (invalidate: model types changed)
         model._options = options or {}  # pylint:disable=protected-access
         return model
 
@@ -669,6 +1125,33 @@ class SwaggerModel:
                              cls.define(api, typename, model, options=getattr(typespec, '__options__', {})))
         return model
 
+    @classmethod
+    def lookup(cls, api, typespec):
+        """
+        Retrieves (and defines, if necessary) Swagger model corresponding to type specification, as per `get()`.
+
+        :param api:      Global Flask-RESTX API within which to access any Swagger models is defined
+        :type  api:      flask_restx.Api
+        :param typespec: Name or class referring to Swagger model
+        :type  typespec: Union(str, type)
+
+        :return: Swagger model, if any
+        :rtype:  Union(Model, None)
+
+        .. note::
+         * Results (including the absence of a model) are cached (per API), and invalidated as models are defined.
+        """
+        cache = getattr(api, 'model_lookup_cache', None)
+        if cache is None or cache[0] != len(api.models):  # (models added, possibly directly via API)
+            cache = api.model_lookup_cache = (len(api.models), {})
+        try:
+            return cache[1][typespec]
+        except KeyError:
+            model = cache[1][typespec] = cls.get(api, typespec)
+        except TypeError:  # (unhashable type specification: no caching)
+            model = cls.get(api, typespec)
+        return model
+
     @staticmethod
     def instance_as_dict(api, model_obj):
         """
@@ -700,11 +1183,17 @@ class PythonFuncDoc:
         X_HTTP = ":http:"  # (extension to support auto-gen)
         X_HEADER = ":header"  # (extension to support header parameters)
 
+        ALL = (PARAM, PARAM_TYPE, RETURN, RETURN_TYPE, X_HTTP, X_HEADER)
+        ANY_PATT = re.compile('|'.join(map(re.escape, ALL)))  # (any token, for single-pass section detection)
+
     # noinspection RegExpRedundantEscape
     PARAM_TAG_PATT = re.compile(r'(\[.+\])?(.*)')
+    MULTISPACE_PATT = re.compile(r'  +')  # (runs of blanks to be collapsed)
+    VT_LINE_PATT = re.compile(r'^([^\S\n\v]*)(.*\v.*)$', re.MULTILINE)  # (leading whitespace, VT-separated text)
 
     DOC_SECTION_SEP = "\n\n"  # Docstring inter-section separator
     DOC_NOTES = ".. note::"  # Docstring embedded notes indicator
+    DESC_ATTRS = ('help', 'type')  # Descriptive attributes extracted from parameter/return commentary
 
     @staticmethod
     def globals(func, clsname=None):
@@ -719,7 +1208,7 @@ class PythonFuncDoc:
         :return: Globals dictionary
         :rtype:  dict
         """
-        func = getattr(func, '__wrapped__', func)
+        func = _unwrapped(func)
         clsvars = dict(func.__globals__)
         if not clsname:
             clsname = func.__qualname__.split('.')[0] if '.' in func.__qualname__ else ''
@@ -727,15 +1216,16 @@ class PythonFuncDoc:
             clsvars.update(vars(clsvars.get(clsname)))
         return clsvars
 
+    @staticmethod
+    def substitute(text, clsvars):
+        """ Generic utility to substitute `$`-prefixed placeholders in text (if any) from the specified variables. """
+        return Template(text).safe_substitute(**clsvars) if '$' in text else text
+
     @staticmethod
     def vtsubst(text):
         """ Generic utility to substitute ASCII VT characters with indented newline separation. """
         if '\v' in text:
-            lines = text.split('\n')
-            for i, line in enumerate(lines):
-                subs = line.split('\v')
-                lines[i] = ('\n' + ' ' * (len(subs[0]) - len(subs[0].lstrip())) if len(subs) > 1 else '').join(subs)
-            text = '\n'.join(lines)
+            text = PythonFuncDoc.VT_LINE_PATT.sub(lambda m: m[1] + m[2].replace('\v', '\n' + ' ' * len(m[1])), text)
         return text
 
     @classmethod
@@ -761,26 +1251,34 @@ class PythonFuncDoc:
             - The synopsis section is taken from the first function in the group that defines it non-vacuously.
             - The non-commentary section information returned (if any) is the union of all such sections found in all
               function docstrings in the group.
+         * Results are memoized per function group (docstrings are invariant).
         """
         if callable(funcs):
             funcs = {None: funcs}
+        if not any(_unwrapped(func).__doc__ for func in funcs.values()):  # (nothing documented: nothing to parse)
+            return '' if desc_only else cls.DOC_SECTION_SEP
+        return cls._extract_doc(tuple(funcs.items()), desc_only)
+
+    @classmethod
+    @lru_cache(maxsize=2048)
+    def _extract_doc(cls, funcitems, desc_only):
+        """ Internal utility: Performs (memoized) extract_doc() for a function group, as a tuple of mapping items. """
         doc = ''
         supplinfo = ''
-        doc_tokens = [v for k, v in vars(cls.DocToken).items() if not k.startswith('__')]
-        for i, (_, func) in enumerate(funcs.items()):
-            func = getattr(func, '__wrapped__', func)
+        for i, (_, func) in enumerate(funcitems):
+            func = _unwrapped(func)
             funcdoc = func.__doc__
             if not funcdoc:
                 continue
 
             funcdoc = '\n'.join((line.rstrip() for line in funcdoc.split('\n')))
-            sections = [s for s in funcdoc.split(cls.DOC_SECTION_SEP) if not any((dt in s for dt in doc_tokens))]
+            sections = [s for s in funcdoc.split(cls.DOC_SECTION_SEP) if not cls.DocToken.ANY_PATT.search(s)]
             if not doc:
-                doc = re.sub(r'  +', ' ', dedent(sections[0]).strip())
+                doc = cls.MULTISPACE_PATT.sub(' ', dedent(sections[0]).strip())
 
             clsname = func.__qualname__.split('.')[0] if '.' in func.__qualname__ else ''
-            clsvars = cls.globals(func, clsname=clsname)
-            doc = Template(doc).safe_substitute(**clsvars)
+            clsvars = cls.globals(func, clsname=clsname) if '$' in funcdoc else {}
+            doc = cls.substitute(doc, clsvars)
             if desc_only:
                 break
 
@@ -788,10 +1286,32 @@ class PythonFuncDoc:
             # noinspection PyTypeChecker
             notesrepl = ((notesrepl if notesrepl not in supplinfo else '') +
                          ("{}\n<br>... [{}]".format('\n' if supplinfo else '', clsname) if i > 0 else ''))
-            supplinfo += cls.vtsubst(dedent(Template(cls.DOC_SECTION_SEP.join(sections[1:])).safe_substitute(**clsvars))
+            supplinfo += cls.vtsubst(dedent(cls.substitute(cls.DOC_SECTION_SEP.join(sections[1:]), clsvars))
                                      .strip().replace(cls.DOC_NOTES, notesrepl))
         return doc if desc_only else cls.DOC_SECTION_SEP.join((doc, supplinfo))
 
+    @classmethod
+    def tokenize_params(cls, params_doc):
+        """
+        Generic utility to tokenize tagged parameter commentary from a docstring section, in a single scan.
+
+        :param params_doc: Docstring section containing parameter commentary
+        :type  params_doc: str
+
+        :return: (name, help, type) for each parameter, in order of appearance (type is None if not tagged)
+        :rtype:  Iterator[tuple]
+        """
+        param_token, type_token = cls.DocToken.PARAM, cls.DocToken.PARAM_TYPE
+        text = dedent(params_doc).strip()
+        start = text.find(param_token)
+        while start >= 0:
+            start += len(param_token)
+            end = text.find(param_token, start)
+            help_def, sep, type_def = text[start:end if end >= 0 else len(text)].partition(type_token)
+            name, _, help_text = help_def.strip().partition(':')
+            yield name, help_text, type_def.strip().partition(':')[2] if sep else None
+            start = end
+
     @classmethod
     def extract_annotations(cls, func):
         """
@@ -814,18 +1334,27 @@ class PythonFuncDoc:
                   * required: positional parameter (missing => False)
                   * default: default value for keyword parameter (missing for positional parameters)
         :rtype:  str
+
+        .. note::
+         * Results are memoized per function (docstrings and signatures are invariant); each call returns its own
+           copies of the information dictionaries, which callers are free to modify.
         """
+        params_info, return_info, http_info = cls._extract_annotations(_unwrapped(func))
+        return {k: dict(v) for k, v in params_info.items()}, dict(return_info), http_info
+
+    @classmethod
+    @lru_cache(maxsize=2048)
+    def _extract_annotations(cls, func):
+        """ Internal utility: Performs (memoized) extract_annotations() for an unwrapped function. """
         # Use Python introspection to extract parameter names, default values, and positional vs. keyword.
-        func = getattr(func, '__wrapped__', func)
         argspec = inspect.getfullargspec(func)
         funcname = func.__qualname__
         annotations = getattr(argspec, 'annotations', {})
         param_names = [a for a in argspec.args if a not in ('self', 'this', '_', '__')]
         npos = len(param_names) - len(argspec.defaults or ())
-        params_info = OrderedDict((name,
-                                   dict(required=True) if i < npos else
-                                   dict(required=False, default=argspec.defaults[i - npos]))
-                                  for i, name in enumerate(param_names))
+        params_info = {name: (dict(required=True) if i < npos else
+                              dict(required=False, default=argspec.defaults[i - npos]))
+                       for i, name in enumerate(param_names)}
         return_info = {}
         http_info = ''
 
@@ -834,27 +1363,17 @@ class PythonFuncDoc:
         doc = "\n".join([line.rstrip() for line in (getattr(func, '__doc__', '') or '').split("\n")])
         docsects = doc.split(cls.DOC_SECTION_SEP)[1:]  # (docstring sections, sans synopsis)
         if docsects:
-            desc_attrs = "help type".split()
             params_sect = 0  # (param commentary presumed to be in docstring section following synopsis)
             return_sect = 1  # (return commentary presumed to be in docstring section following params)
 
             # Extract param annotations (if present).
             params_doc = docsects[params_sect] + ' '
-            ind = len(params_doc) - len(params_doc.lstrip()) + len(cls.DocToken.PARAM) + 1
             if cls.DocToken.PARAM in params_doc:
-                params_list = dedent(params_doc).strip().split(cls.DocToken.PARAM)
-                # pylint:disable=unnecessary-comprehension
-                params_list = [([[t for t in a.strip().split(':', maxsplit=1)]
-                                 for a in p.split(cls.DocToken.PARAM_TYPE, maxsplit=1)] + [['', None]])[:2]
-                               for p in params_list if p]
-                # (list of pairs of pairs: for each param, outer pair is (help, type), inner pair is (name, content))
-
-                params_dict = OrderedDict((pdpairs[0][0],
-                                           dict(zip(desc_attrs,
-                                                    (cls.vtsubst(dedent(Template((ind + len(p[0])) * ' ' + (p[1] or ''))
-                                                                        .safe_substitute(**cls.globals(func)).strip()))
-                                                     for p in pdpairs))))
-                                          for pdpairs in params_list)
+                clsvars = cls.globals(func) if '$' in params_doc else {}
+                params_dict = {name: dict(zip(cls.DESC_ATTRS,
+                                              (cls.vtsubst(cls.substitute(text or '', clsvars).strip())
+                                               for text in (help_text, type_text))))
+                               for name, help_text, type_text in cls.tokenize_params(params_doc)}
                 # (dict-of-dicts for params: outer dict keyed by param name, inner dict is help and type content)
 
                 # Extract and validate parameter types.
@@ -881,7 +1400,7 @@ class PythonFuncDoc:
                 return_def = dedent(return_doc.strip().replace(cls.DocToken.RETURN, ' ' * len(cls.DocToken.RETURN)))
                 # noinspection PyTypeChecker
                 return_def = (return_def.split(cls.DocToken.RETURN_TYPE) + [None])[:2]
-                return_info = dict(zip(desc_attrs, (t if t is None else t.strip() for t in return_def)))
+                return_info = dict(zip(cls.DESC_ATTRS, (t if t is None else t.strip() for t in return_def)))
                 if return_info['type'] is None:
                     return_info['type'] = annotations.get('return')
                 if not return_info['type']:
@@ -909,6 +1428,11 @@ class SwaggerResource(Resource):
 
     DEFAULT_PARSER_FMT = "PARSER_{method}"
     DEFAULT_SUCCESS_FMT = "SUCCESS_{method}"
+    SYNOPSIS_TRANS = str.maketrans({'\n': ' ', '.': '\u2024'})  # (single-line synopsis, with embedded "periods")
+    # (request location and field type for parameters of special type, by type name; `FileStorage` instances => 'File')
+    SPECIAL_PARAM_TYPES = {'Password': ('form', Password),
+                           'File': ('files', FileStorage)}
+    cache = None  # (response cache for GET requests, e.g., `flask_caching.Cache` instance: see cached_response())
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)  # (for subsequent inheritance)
@@ -1004,10 +1528,25 @@ class SwaggerResource(Resource):
 
         assert callable(handler)
 
+        # Resolve any authorization type(s) required (common to all endpoint methods).
+        auths = getattr(api, 'authorizations') or {}
+        security = auths and (auth.split() if isinstance(auth, str) else auth)
+        if security:
+            if isinstance(security, bool):
+                security = [list(auths)[0]]
+            unknowns = set(compress(security, (k not in auths for k in security)))
+            if unknowns:
+                raise TypeError(f"Unknown authorization type(s): {unknowns} -- must be defined for API")
+        else:
+            security = None
+
         # Generate resource class definition(s) for each endpoint method:
         param_model = None
         docparam = None
         resource_attrs = {}
+        target_docs = {}  # (extracted documentation, per target function)
+        # noinspection PyProtectedMember
+        status_idx = ResponseDesc._fields.index('status')  # (additional responses may be plain tuples)
         orig_docfuncs = docfuncs
         for method, (target_func, sdk_name) in methods.items():
             assert callable(target_func)
@@ -1024,13 +1563,15 @@ class SwaggerResource(Resource):
             # and allow embedded "periods" to form the endpoint synopsis.  When docstring has multiple sections
             # following the param/return commentary sections, those will become the endpoint header comments --
             # always begin the header comments with the SDK function name.
-            doc = PythonFuncDoc.extract_doc(docfuncs)
+            doc = target_docs.get(target_func)
+            if doc is None:
+                doc = target_docs[target_func] = PythonFuncDoc.extract_doc(docfuncs)
             synopsis, *doc = doc.split(PythonFuncDoc.DOC_SECTION_SEP, maxsplit=1)
             doc = '\n\n' + doc[0] if doc else ''
             if not sdk_name:
                 sdk_name = cls.construct_sdk_funcname(target_func.__name__, method.lower())
-            handler_wrapper.__doc__ = (synopsis.replace('\n', ' ').strip().rstrip('.').replace('.', '\u2024') +
-                                       '\n' + f"SDK: `{sdk_name}()`" + doc)
+            synopsis = synopsis.translate(cls.SYNOPSIS_TRANS).strip().rstrip('\u2024')
+            handler_wrapper.__doc__ = f"{synopsis}\nSDK: `{sdk_name}()`{doc}"
 
             # Create a request param parser for this request method.
             param_parser = cls.request_parser(api, target_func, docfuncs=docfuncs, method=method,
@@ -1039,7 +1580,7 @@ class SwaggerResource(Resource):
                 docparam = getattr(param_parser, 'args', None)
                 if docparam:
                     docparam = docparam[0]
-                    if not all(hasattr(docparam, k) for k in 'name help'.split()):
+                    if not all(hasattr(docparam, k) for k in ('name', 'help')):
                         docparam = None
 
             # Construct expected response data definition, if any, for successful response.
@@ -1047,13 +1588,11 @@ class SwaggerResource(Resource):
             result_typespec = response_def.type if response_def else ''
             if response_def:
                 try:
-                    result_type = (TypingJig.field_def_to_field(api, '<result>', dict(type=result_typespec),
-                                                                nest_model=False)
-                                   if result_typespec else None)
+                    result_type = TypingJig.result_field(api, result_typespec) if result_typespec else None
                     if result_typespec and not result_type:
                         raise TypingJig.TypeResolutionError
                 except TypingJig.TypeResolutionError:
-                    result_type = DefaultField()
+                    result_type = TypingJig.field_instance(DefaultField)
                 except (Exception, BaseException):
                     result_type = None
                 # noinspection PyProtectedMember
@@ -1066,16 +1605,6 @@ class SwaggerResource(Resource):
             # SDK function name to generate, specifying Swagger models or aggregations thereof where appropriate.
             param_model = param_parser.model
             if sdk_name or param_model or auth:
-                auths = getattr(api, 'authorizations') or {}
-                security = auths and (auth.split() if isinstance(auth, str) else auth)
-                if security:
-                    if isinstance(security, bool):
-                        security = [list(auths)[0]]
-                    unknowns = set(compress(security, (k not in auths for k in security)))
-                    if unknowns:
-                        raise TypeError(f"Unknown authorization type(s): {unknowns} -- must be defined for API")
-                else:
-                    security = None
                 resource_def = dict(body=param_model or None, id=sdk_name, security=security)
                 header_params = getattr(param_parser, 'header_params', None)
                 if header_params:
@@ -1087,9 +1616,10 @@ class SwaggerResource(Resource):
                 status_code = SwaggerNamespace.canonical_status_code(response_def.status)
                 as_list = marshaller.__class__ == fields.List
                 if as_list:  # (denest container(s) to bottommost contained type)
-                    element = feedback(lambda fld, _: getattr(fld, 'container', None) or
-                                                      (getattr(fld, 'nested', fld), StopIteration),  # noqa:E127
-                                       marshaller, repeat('_'))
+                    element = marshaller
+                    while getattr(element, 'container', None):
+                        element = element.container
+                    element = getattr(element, 'nested', element)
                     if is_model(element):
                         marshaller = element
                     elif is_field_type(element):
@@ -1101,11 +1631,10 @@ class SwaggerResource(Resource):
                                                        description=getattr(response_def, 'help', None))(handler_wrapper)
             if not marshaller and response_def:
                 handler_wrapper = api.response(*response_def)(handler_wrapper)
-            for response in responses or ():
-                # noinspection PyProtectedMember
-                idx = ResponseDesc._fields.index('status')
-                if not response_def or int(response_def[idx]) != int(response[idx]):
-                    handler_wrapper = api.response(*response)(handler_wrapper)
+            if responses:
+                for response in responses:
+                    if not response_def or int(response_def[status_idx]) != int(response[status_idx]):
+                        handler_wrapper = api.response(*response)(handler_wrapper)
 
             # Add handler-related members to the resource class.
             resource_attrs.update({method.lower(): handler_wrapper,
@@ -1130,11 +1659,12 @@ class SwaggerResource(Resource):
 
         # If this route has already been defined in this resource, presumably it defines a different HTTP method,
         # so merge this resource class definition into the existing resource.
-        resroute = [rr for rr in namespace.resources if route in rr.urls]
+        resroute = next((rr for rr in namespace.resources if route in rr.urls), None)
         if resroute:
-            resroute = resroute[0]
             existing_resource = resroute.resource
-            existing_resource.methods = tuple(set(existing_resource.methods) | set(resource_class.methods))
+            existing_methods = tuple(existing_resource.methods)
+            existing_resource.methods = existing_methods + tuple(m for m in resource_class.methods
+                                                                 if m not in existing_methods)
             for key, val in vars(resource_class).items():
                 if not key.startswith('__') and not hasattr(existing_resource, key):
                     setattr(existing_resource, key, val)
@@ -1175,30 +1705,32 @@ class SwaggerResource(Resource):
             args = ()
             kwargs = {}
         else:
-            # Determine names of all positional parameters.
-            positional = [arg.name for arg in parser.args if arg.required]
+            plan = self.parser_plan(parser)  # (includes names of all positional parameters)
 
-            # Accept non-standard JSON formatting extensions (if applicable).
-            self.fixup_json(request)
+            # Accept non-standard JSON formatting extensions (if applicable: only arguments sourced from JSON content
+            # consult it, so the request body need not be parsed otherwise).
+            if plan.json_fixup:
+                self.fixup_json(request)
 
-            # Save original locations from argument definitions.
-            locations = [arg.location for arg in parser.args]
+            # Save original locations from argument definitions (only model arguments are relocated).
+            locations = [arg.argdef.location for arg in plan.model_args]
 
             # Parse arguments, preprocessing as necessary beforehand, which may result in argument(s) being relocated
             # to query parameters (a Flask-RESTX workaround for `Argument.source()` deficiency).
             try:
-                self.preprocess_args(request, parser.args, strict)
+                self.preprocess_args(request, parser, strict)
                 parsed_args = parser.parse_args(request, strict=strict)  # (validate and extract param values)
             finally:
                 # Reinstate original argument definition locations.
-                for i, arg in enumerate(parser.args):
-                    arg.location = locations[i]
+                for arg, location in zip(plan.model_args, locations):
+                    arg.argdef.location = location
 
             # Postprocess successfully parsed arguments: transform model types, etc.
-            parsed_args = self.postprocess_args(request, parser.args, parsed_args)
+            parsed_args = self.postprocess_args(request, parser, parsed_args)
 
             # Segregate param values by parameter-passing mode (positional vs. keyword).
-            args, kwargs = (tuple(parsed_args.get(p) for p in positional),  # (segregate
+            positional = plan.positional_set
+            args, kwargs = (tuple(parsed_args.get(p) for p in plan.positional),  # (segregate
                             {k: v for k, v in parsed_args.items() if k not in positional and not k.startswith('__')})
         return parser.func, args, kwargs
 
@@ -1225,13 +1757,90 @@ class SwaggerResource(Resource):
         else:  # (not designated as JSON content in request header, but may be)
             with suppress(Exception):
                 if request.data:  # (body data)
-                    jsonval = json.loads(request.data.decode())
+                    jsonval = json_loads(request.data)
                 elif request.form:  # (accept form data that contains JSON-formatted data)
-                    jsonval = json.loads(next(iter(request.form.to_dict())))
+                    jsonval = json_loads(next(iter(request.form.to_dict())))
         if jsonval is not None:
             request._cached_json = (jsonval, jsonval)  # pylint:disable=protected-access
         return request
 
+    @staticmethod
+    def plan_args(reqargs):
+        """
+        Precomputes the request-invariant processing metadata for a collection of request argument definitions.
+
+        :param reqargs: Collection of argument definitions for Flask request
+        :type  reqargs: Iterable
+
+        :return: Processing metadata for each (uniquely-named) argument definition
+        :rtype:  tuple<ArgPlan>
+        """
+        plan = []
+        for argdef in {arg.name: arg for arg in reqargs}.values():
+            argtype = getattr(argdef, 'type', None)
+            locations = (argdef.location,) if isinstance(argdef.location, str) else tuple(argdef.location)
+            model_arg = is_model(argtype)
+            model_opts = model_class = None
+            if model_arg:  # (model value postprocessing options: skip None values, discard missing keys)
+                options = getattr(argtype, '_options', {})
+                model_opts = (options.get('skip_none', False), not options.get('store_missing', True),
+                              frozenset(k for k, v in argtype.items() if getattr(v, 'skip_none', False)))
+                model_class = type(argtype.name, (OmniDict,), {})  # (class for parsed model values)
+            # noinspection PyArgumentList
+            plan.append(ArgPlan(name=argdef.name, argdef=argdef, argtype=argtype, locations=locations,
+                                body_arg=any(loc in ('json', 'form') for loc in locations),
+                                json_arg='json' in locations, model_arg=model_arg,
+                                dict_arg=argtype is dict or model_arg, nullable=getattr(argdef, 'nullable', False),
+                                model_opts=model_opts, model_class=model_class))
+        return tuple(plan)
+
+    @classmethod
+    def parser_plan(cls, parser):
+        """
+        Retrieves the request-invariant processing metadata for a request parser.
+
+        :param parser: Flask-RESTX request parser
+        :type  parser: flask_restx.reqparse.RequestParser
+
+        :return: Processing metadata for request parser
+        :rtype:  ParserPlan
+
+        .. note::
+         * The plan is computed once per request parser (and recomputed if arguments are subsequently added to it).
+        """
+        plan = getattr(parser, 'arg_plan', None)
+        if plan is None or plan.nargs != len(parser.args):
+            args = cls.plan_args(parser.args)
+            positional = tuple(arg.name for arg in parser.args if arg.required)
+            # noinspection PyArgumentList
+            plan = parser.arg_plan = ParserPlan(args=args, model_args=tuple(arg for arg in args if arg.model_arg),
+                                                positional=positional, positional_set=frozenset(positional),
+                                                json_fixup=any(arg.json_arg or arg.model_arg for arg in args),
+                                                nargs=len(parser.args))
+        return plan
+
+    @classmethod
+    def arg_plan(cls, reqargs, models_only=False):
+        """
+        Retrieves the argument processing metadata for a request parser (or collection of argument definitions).
+
+        :param reqargs:     Flask-RESTX request parser, or collection of argument definitions for Flask request
+        :type  reqargs:     Union(flask_restx.reqparse.RequestParser, Iterable)
+        :param models_only: "Retrieve metadata only for arguments of model type."
+        :type  models_only: bool
+
+        :return: Processing metadata for each (uniquely-named) argument definition
+        :rtype:  tuple<ArgPlan>
+
+        .. note::
+         * For a request parser, this is retained in its processing metadata (see `parser_plan()`).
+        """
+        if not isinstance(reqargs, reqparse.RequestParser):
+            plan = cls.plan_args(reqargs)
+            return tuple(arg for arg in plan if arg.model_arg) if models_only else plan
+        plan = cls.parser_plan(reqargs)
+        return plan.model_args if models_only else plan.args
+
     @classmethod
     def preprocess_args(cls, request, reqargs, strict):  # noqa:C901
         """
@@ -1239,52 +1848,50 @@ class SwaggerResource(Resource):
 
         :param request: Flask request object
         :type  request: flask.request
-        :param reqargs: Collection of argument definitions for Flask request
-        :type  reqargs: Iterable
+        :param reqargs: Flask-RESTX request parser, or collection of argument definitions for Flask request
+        :type  reqargs: Union(flask_restx.reqparse.RequestParser, Iterable)
         :param strict:  "Validate model contents."
         :type  strict:  bool
         """
-        argdefs = {arg.name: arg for arg in reqargs}
         # noinspection PyPropertyAccess
-        request.args = request.args.to_dict()  # (make specified request arguments dictionary mutable)
+        args = request.args = request.args.to_dict() if request.args else {}  # (make request args dictionary mutable)
+        is_json = request.is_json  # (request-invariant)
         before = False
 
-        for argname, argdef in argdefs.items():
-            argval = request.args.get(argname, NotImplemented)
-            argtype = getattr(argdef, 'type', None)
-            model_arg = is_model(argtype)
-            location = (argdef.location,) if isinstance(argdef.location, str) else argdef.location
-            body_arg = any(loc in ('json', 'form') for loc in location)
+        # (positional unpacking of argument plan, for speed: must track `ArgPlan` fields)
+        for (argname, argdef, argtype, locations, body_arg, _json_arg, model_arg, dict_arg, nullable,
+             _model_opts, _model_class) in cls.arg_plan(reqargs):
+            argval = args.get(argname, NotImplemented)
             if model_arg:
                 # Special case: model/aggregate param from request body -- only works for one param --
                 # relocate to value params (Flask-RESTX deficiency) for this request
                 if body_arg and not before:
-                    if request.is_json:
+                    if is_json:
                         argval = request.json.copy()
                         request.json.clear()
                     else:
                         argval = request.form or request.data
                     before = True
                 if argval is not NotImplemented:
-                    request.args[argname] = argval
-                argdef.location = 'values'  # (caution: changes location persistently; must reinstate after parsing)
+                    args[argname] = argval
+                argdef.location = 'values'  # (caution: changes location persistently; reinstate after parsing)
 
             if argval is NotImplemented:
-                if 'json' in location and request.is_json:
+                if is_json and 'json' in locations:
                     argval = request.json.get(argname, NotImplemented)
-                elif 'form' in location and request.form:
+                elif 'form' in locations and request.form:
                     argval = request.form.get(argname, NotImplemented)
 
             if argval is not NotImplemented:
                 # Consider "none" (text) as vacuous value for query param if value can be vacuous.
-                if getattr(argdef, 'nullable', False) and argval in ('None', 'none') and request.args.get(argname):
+                if nullable and argval in ('None', 'none') and args.get(argname):
                     # noinspection PyTypeChecker
-                    request.args[argname] = None
+                    args[argname] = None
 
                 # Validate model contents when applicable.
-                elif argtype is dict or model_arg:
-                    request.args[argname] = argval = str_to_dict(argval)
-                    if strict and isinstance(argtype, Model):
+                elif dict_arg:
+                    args[argname] = argval = json_str_to_dict(argval)
+                    if strict and model_arg:
                         cls.validate_model_payload(argtype, argval)
 
     @classmethod
@@ -1294,29 +1901,24 @@ class SwaggerResource(Resource):
 
         :param request: Flask request object
         :type  request: flask.request
-        :param reqargs: Collection of argument definitions for Flask request
-        :type  reqargs: Iterable
+        :param reqargs: Flask-RESTX request parser, or collection of argument definitions for Flask request
+        :type  reqargs: Union(flask_restx.reqparse.RequestParser, Iterable)
         :param argvals: Parsed argument values
         :type  argvals: ParseResult
 
         :return: Adjusted parsed argument values
         :rtype:  ParseResult
         """
-        argdefs = {arg.name: arg for arg in reqargs}
-        for argname, argdef in argdefs.items():
-            argtype = getattr(argdef, 'type', None)
-            if is_model(argtype):
-                argval = argvals.get(argname)
-                if argval:
-                    options = getattr(argtype, '_options', {})
-                    skip_none = options.get('skip_none', False)
-                    discard_missing = not options.get('store_missing', True)
-                    reqval = request.args.get(argname, {})
-                    for key in list(argval.keys()):
-                        if ((skip_none or getattr(argdef.type.get(key), 'skip_none', False)) and argval[key] is None or
-                                discard_missing and key not in reqval):
-                            argval.pop(key)
-                    argvals[argname] = type(argtype.name, (OmniDict,), {})(**argval)
+        for arg in cls.arg_plan(reqargs, models_only=True):  # (only model arguments need postprocessing)
+            argname = arg.name
+            argval = argvals.get(argname)
+            if argval:
+                skip_none, discard_missing, skip_none_keys = arg.model_opts
+                reqval = request.args.get(argname, {})
+                argval = {k: v for k, v in argval.items()  # (omit None values to skip, and missing keys to discard)
+                          if not ((skip_none or k in skip_none_keys) and v is None or
+                                  discard_missing and k not in reqval)}
+                argvals[argname] = arg.model_class(**argval)
 
         return argvals
 
@@ -1327,7 +1929,10 @@ class SwaggerResource(Resource):
             model.validate(model_dict)  # (validate model values/types)
         except HTTPException as _exc:
             exc = _exc
-            model_fields = {f for f, d in model.items() if type(d).__name__ in vars(fields)}
+            model_fields = getattr(model, '_field_names', None)  # (invariant per model: computed once)
+            if model_fields is None:
+                model_fields = model._field_names = frozenset(  # pylint:disable=protected-access
+                    f for f, d in model.items() if type(d).__name__ in _FLASK_FIELDS_SYMBOLS)
             extraneous = {f: "item not in model" for f in set(model_dict) - model_fields}
             if extraneous:
                 if _exc:
@@ -1368,6 +1973,7 @@ class SwaggerResource(Resource):
                   * params: Model for request parameters, if defined (None => parameters defined individually)
                   * result: `ResponseDesc` tuple describing the successful response from the handler function,
                             suitable for use with `api.response()` (None => N/A or undefined)
+                  * arg_plan: Precomputed request processing metadata (see `parser_plan()`)
         :rtype:  flask_restx.RequestParser
         """
         # Extract synopsis/notes and from (any of) the handler function(s).
@@ -1381,7 +1987,7 @@ class SwaggerResource(Resource):
             # Extract parameter/result commentary and/or annotations from all handler functions, combining and
             # differentiating by class in the case of an inheritance lineage.
             def _tag_param(_clsname, _param):
-                _match = re.fullmatch(PythonFuncDoc.PARAM_TAG_PATT, _param.get('help', ''))
+                _match = PythonFuncDoc.PARAM_TAG_PATT.fullmatch(_param.get('help', ''))
                 if _match:
                     _tag, _text = _match.groups()
                     _param['help'] = f"[{_tag}, {_clsname}] {_text[1:-1]}" if _tag else f"[{_clsname}] {_text}"
@@ -1390,7 +1996,7 @@ class SwaggerResource(Resource):
             params, result, _method = PythonFuncDoc.extract_annotations(docfuncs.pop(None) or docfunc)
             method = (method or _method or DefaultHTTPMethod).upper()
 
-            clsparams = OrderedDict({None: params})
+            clsparams = {None: params}
             allkeys = set(params.keys())
             commonparams = None
             for clsname, svcfunc in docfuncs.items():
@@ -1399,16 +2005,15 @@ class SwaggerResource(Resource):
                 _params, _result, _ = PythonFuncDoc.extract_annotations(svcfunc)
                 if not result:
                     result = _result  # @@@ TODO: Merge disparate result types among all (sub)classes
-                clsparams[clsname] = _params = OrderedDict((k, _params[k]) for k in _params if k not in allkeys)
+                clsparams[clsname] = _params = {k: _params[k] for k in _params if k not in allkeys}
                 commonparams = (_params if commonparams is None else
-                                OrderedDict((k, v) for k, v in commonparams.items() if k in _params))
+                                {k: v for k, v in commonparams.items() if k in _params})
             params.update(commonparams or {})
             allkeys = set(params.keys())
             for clsname, _params in clsparams.items():
                 if clsname:
                     # noinspection PyTypeChecker
-                    params.update(OrderedDict((k, _tag_param(clsname, v))
-                                              for k, v in _params.items() if k not in allkeys))
+                    params.update({k: _tag_param(clsname, v) for k, v in _params.items() if k not in allkeys})
 
         # Create a vanilla Flask-RESTX request parser.
         parser = reqparse.RequestParser()
@@ -1427,22 +2032,24 @@ class SwaggerResource(Resource):
                 param_type = 'File'
             else:
                 param_type = param_def.get('type', None)
-                model = SwaggerModel.get(api, param_type)
+                model = SwaggerModel.lookup(api, param_type)
                 if model:
                     param_type = param_def['type'] = model
                     if len(params) > 1:
                         model = None
                     param_def['location'] = 'form' if 'form' in loc else 'json'
 
-            if param_type == 'Password':
-                param_def['location'] = 'form'
-                param_def['type'] = Password
+            if isinstance(param_type, str):
+                special = cls.SPECIAL_PARAM_TYPES.get(param_type)
+            else:
+                special = cls.SPECIAL_PARAM_TYPES['File'] if type(param_type).__name__ == 'FileStorage' else None
+            if special:
+                param_def['location'], param_type = special
+                param_def['type'] = param_type
             elif param_type == 'header':
-                headers[name] = {'in': 'header', 'description': re.sub(r' +', ' ', param_def.get('help', name))}
+                headers[name] = {'in': 'header',
+                                 'description': PythonFuncDoc.MULTISPACE_PATT.sub(' ', param_def.get('help', name))}
                 continue
-            elif param_type == 'File' or param_type.__class__.__name__ == 'FileStorage':
-                param_def['location'] = 'files'
-                param_type = param_def['type'] = FileStorage
             elif param_type and not is_model(param_type):
                 param_type = param_def['type'] = TypingJig.typespec_to_param_converter(api, param_type, param_def)
 
@@ -1456,6 +2063,7 @@ class SwaggerResource(Resource):
         parser.method = method
         parser.model = model
         parser.header_params = headers
+        cls.parser_plan(parser)  # (precompute request processing metadata)
         # noinspection PyArgumentList
         parser.result = (ResponseDesc(HTTPStatus.OK if result else HTTPStatus.NO_CONTENT,
                                       (result or {}).get('help', "Success"),
@@ -1485,6 +2093,7 @@ class SwaggerResource(Resource):
         return '_'.join((method, camel_to_dash(resource_name)))
 
     @staticmethod
+    @lru_cache(maxsize=1024)
     def construct_sdk_funcname(resource_name, method):
         """
         Uses rules to synthesize a terse, meaningful SDK function name from an HTTP method and resource name.
@@ -1517,6 +2126,42 @@ class SwaggerResource(Resource):
         result = dict(message=str(result).strip())
         return result, status
 
+    @classmethod
+    def cached_response(cls, timeout=None):
+        """
+        Decorator: Caches responses from a request handler for GET requests, if a response cache is configured.
+
+        :param timeout: Cache timeout for responses, in seconds (None => cache default)
+        :type  timeout: Union(int, None)
+
+        :return: Decorator for request handler function
+        :rtype:  Callable
+
+        .. note::
+         * Applications enable caching by assigning a cache object to `SwaggerResource.cache` (e.g.,
+           `SwaggerResource.cache = flask_caching.Cache(app)`); any object providing a Flask-Caching compatible
+           `cached()` decorator factory suffices.  Without one, handlers are invoked directly.
+         * The cache is resolved when requests are handled, so handlers may be decorated before it is assigned (or
+           reassigned: the handler is rebound to the cache currently assigned).
+         * Responses are cached per request path and query string; use only for idempotent endpoints.
+        """
+        def decorator(func):
+            bound = (None, None)  # (cache most recently used, and cached variant of handler for it)
+
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                nonlocal bound
+                cache = cls.cache
+                if cache is None or flask_request.method != 'GET':
+                    return func(*args, **kwargs)
+                bound_cache, cached_func = bound
+                if bound_cache is not cache:  # (first use, or cache since replaced)
+                    cached_func = cache.cached(timeout=timeout, query_string=True)(func)
+                    bound = (cache, cached_func)
+                return cached_func(*args, **kwargs)
+            return wrapper
+        return decorator
+
     @staticmethod
     def sanitize_for_json(obj, as_json=False):
         """
@@ -1533,30 +2178,10 @@ class SwaggerResource(Resource):
         .. note::
          * Sanitizes nested subdictionaries and lists, if specified or present as items within `obj`.
          * (Sub)objects containing a `__dict__` element are treated as dicts if direct serialization of them fails.
+         * The JSONifiable representation is produced directly, equivalently to (but without) a Python `json` round
+           trip; the JSONification is produced by Python `json`.
         """
-        class _JSONEncoder(json.JSONEncoder):
-            def default(self, item):  # pylint:disable=arguments-renamed
-                try:
-                    encoding = super().default(item)
-                except TypeError:
-                    if hasattr(item, '__encoder__'):
-                        encoding = item.__encoder__(item)
-                    else:
-                        if hasattr(item, '__dict__'):
-                            item = vars(item)
-                        if isinstance(item, dict):
-                            encoding = _encode(item)
-                        elif isinstance(item, (list, tuple)):
-                            encoding = [_encode(e) for e in item]
-                        else:
-                            encoding = str(item)
-                return encoding
-
-        def _encode(_obj, _load=True):
-            _json = json.dumps(dictify(_obj), cls=_JSONEncoder)
-            return json.loads(_json) if _load else _json
-
-        return _encode(obj, _load=not as_json)
+        return _sanitize_encode(obj, load=not as_json)
 
 
 class SwaggerWrapper(flask_restx.swagger.Swagger):
@@ -1579,34 +2204,31 @@ class SwaggerWrapper(flask_restx.swagger.Swagger):
         self._registered_models = self.api.models  # (always include all models)
         try:  # pylint:disable=too-many-nested-blocks
             swagger_spec = super().as_dict()
-            exclusions = []
+            paths = swagger_spec['paths']
+            models = self._registered_models
 
             # Sweep through all defined resource endpoints.
-            for path, resource in swagger_spec['paths'].items():
-                # Omit any "internal" endpoints (with underscore-prefixed path name component).
-                if '/_' in path:
-                    exclusions.append(path)
-
+            for resource in paths.values():
                 # Convert Flask-RESTX-misrepresented parameters of model type (data passed in body).
                 for resource_def in resource.values():
                     if not isinstance(resource_def, dict):
                         continue
-                    for param_def in resource_def.get('parameters', {}):
+                    for param_def in resource_def.get('parameters', ()):
                         if not param_def.get('in') in ('body', 'formData'):  # (only body-passed parameters need fixing)
                             continue
-                        schema = param_def.get('schema', {})
-                        if schema.get('type') != 'object':  # (faulty schema: generic object instead of a model ref)
+                        schema = param_def.get('schema')
+                        if not schema or schema.get('type') != 'object':  # (faulty schema: not a model ref)
                             continue
                         for param_name, type_def in schema.get('properties', {}).items():
                             model_name = type_def.get('type')
-                            if model_name in self._registered_models:
+                            if model_name in models:
                                 param_def['schema'] = {'$ref': f'#/definitions/{model_name}'}
                                 param_def['name'] = param_name  # (also correct goofy parameter renaming to 'payload')
                             break  # (single properties definition)
 
-            # Exclude endpoints for all resources with "private" names.
-            for path in exclusions:
-                del swagger_spec['paths'][path]
+            # Exclude endpoints for all resources with "private" names (underscore-prefixed path name component).
+            for path in [path for path in paths if '/_' in path]:
+                del paths[path]
 
         except (Exception, BaseException) as exc:
             # noinspection PyTypeChecker
@@ -1631,11 +2253,12 @@ class SwaggerWrapper(flask_restx.swagger.Swagger):
 # pylint:disable=attribute-defined-outside-init
 class SwaggerRequestHandler(WSGIRequestHandler):
     """ Overrides for official Flask/Werkzeug Request handler. """
-    @staticmethod
-    def _redact_path(path):
+    REDACT_PATT = re.compile(r'(\w*password\w*|\w*token\w*)=[^ &]+')  # (sensitive query params)
+
+    @classmethod
+    def _redact_path(cls, path):
         """ Internal utility: Redacts sensitive query params from a path. """
-        redacted = r'\w*password\w*|\w*token\w*'
-        return re.sub(fr'({redacted})=[^ &]+', r'\1=...', path)
+        return cls.REDACT_PATT.sub(r'\1=...', path)
 
     @classmethod
     def redact_line(cls, line):
@@ -1672,3 +2295,7 @@ class SwaggerRequestHandler(WSGIRequestHandler):
         with suppress(Exception):
             self.log_request_info(self.raw_requestline)
         return super().parse_request()
+
+
+# (Snapshot global names for type specification evaluation, now that all are defined: see TypingJig.symbols().)
+TypingJig.MODULE_SYMBOLS = {**_TYPING_SYMBOLS, **globals()}
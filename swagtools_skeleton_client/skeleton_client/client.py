@@ -12,8 +12,9 @@ import os
 from pathlib import Path
 import re
 import socket
-
-from unittest.mock import MagicMock
+from functools import lru_cache
+from collections import ChainMap
+from types import SimpleNamespace
 
 # noinspection PyPackageRequirements,PyUnresolvedReferences
 from cinch_pyutils.imports import (import_module_source, apply_environ, update_environ, add_sys_path)
@@ -21,12 +22,22 @@ from cinch_pyutils.imports import (import_module_source, apply_environ, update_e
 from cinch_pyutils.networking import get_ipaddr
 
 THISDIR = Path(__file__).resolve().parent
+PS1_HOST_PATT = re.compile(r".*@(.*):.*")  # (hostname embedded within a shell prompt)
 
 # Include externally-generated code on module path (necessary because of how imports are specified in that code)
 CLIENT_DIR = add_sys_path(THISDIR.parent, prepend=True)
 EXT_DIR = add_sys_path(THISDIR.joinpath('ext'), prepend=True)
-sys.modules.pop('sdk', None)
-sys.modules.pop('sdk.models', None)
+
+
+def is_ext_module(module):
+    """ Determines whether a module was loaded from the externally-generated code tree for this client. """
+    module_file = getattr(module, '__file__', None)
+    return bool(module_file) and Path(EXT_DIR) in Path(module_file).resolve().parents
+
+
+for _sdk_module in ('sdk', 'sdk.models'):  # (purge any other Swagger SDK already imported, but retain this one's)
+    if not is_ext_module(sys.modules.get(_sdk_module)):
+        sys.modules.pop(_sdk_module, None)
 
 try:  # (Assume that there exists a Python SDK generated externally by swagger-codegen)
     # Imports from externally-generated SDK:
@@ -41,7 +52,17 @@ except ImportError:  # (No Python SDK)
     class GeneratedAPIClient:  # pylint:disable=missing-class-docstring,too-few-public-methods
         def __del__(self):
             pass
-    sdk = MagicMock()
+
+    class _StubApi:  # pylint:disable=too-few-public-methods
+        """ Stand-in for a client API of the (absent) SDK: all endpoint functions are no-ops. """
+        def __init__(self, api_client=None, *_, **__):
+            self.api_client = api_client
+
+        def __getattr__(self, name):
+            if name.startswith('__'):
+                raise AttributeError(name)
+            return lambda *_, **__: None
+    sdk = SimpleNamespace(ManagerApi=_StubApi, OperationsApi=_StubApi, ServicesApi=_StubApi)
 
     class SkeletonSDKException(Exception):  # pylint:disable=missing-class-docstring,too-few-public-methods
         pass
@@ -56,6 +77,8 @@ class APIClientMeta(type):
     """
     def __init__(cls, name, bases, dct):
         super().__init__(name, bases, dct)
+        if getattr(cls, 'ServiceConfig', None) is not None:  # (subclass: inherits configuration already resolved)
+            return
         config_file = Path(os.getenv('SERVICE_CONFIG', str(THISDIR.joinpath('service_config.sh')))).expanduser()
         cls.ServiceConfig = import_module_source('ServiceConfig', config_file, execute=True)
         cls.ServiceConfig.resolve_config = cls.resolve_config
@@ -70,7 +93,18 @@ class APIClientMeta(type):
         """
         Utility method: Resolves the absolute path to the service client configuration file specified absolutely
         or relative to this directory and with or without a default suffix.
+
+        .. note::
+         * Resolutions are memoized (per current directory, for a relative path).
         """
+        config_path = str(config_path)
+        # noinspection PyProtectedMember
+        return APIClientMeta._resolve_config(config_path, None if Path(config_path).is_absolute() else os.getcwd())
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _resolve_config(config_path, _cwd):
+        """ Internal utility: Resolves service client configuration file path (see `resolve_config()`). """
         config_path = Path(config_path)
         for suffix in [None] + (['', '.sh'] if not config_path.is_absolute() else []):
             if suffix is not None:
@@ -94,6 +128,7 @@ class APIClient(GeneratedAPIClient, metaclass=APIClientMeta):
      * This generic interface object is the common base for the client API corresponding to each resource group.
     """
     Singleton = None
+    _hostname = None  # (memoized local hostname, with resolution context: see resolve_hostname())
 
     def __init__(self):
         # noinspection PyUnresolvedReferences
@@ -130,9 +165,9 @@ class APIClient(GeneratedAPIClient, metaclass=APIClientMeta):
             if not cls.Singleton:
                 raise ImportError("ERROR: {} not successfully imported: cannot find 'api_client'".format(cls.__name__))
             try:
-                api_client = manager_api.api_client
+                api_client = controller_api('manager_api').api_client
             except (Exception, BaseException):
-                api_client = services_api.api_client  # pylint:disable=used-before-assignment
+                api_client = controller_api('services_api').api_client
 
         if host and host != 'localhost':  # (remote host specified)
             try:
@@ -148,10 +183,9 @@ class APIClient(GeneratedAPIClient, metaclass=APIClientMeta):
                 print("WARNING: No Swagger API server hostname specified or configured, assuming '{}'"
                       .format(flask_host))
             host = flask_host
-            setattr(service_config, 'IS_HOSTED_REMOTELY', False)
-        os.environ['HTTP_SERVICE_HOST'] = host
-        os.environ['HTTP_SERVICE_PORT'] = str(port)
-        os.environ['HTTP_SERVICE_SOCKADDR'] = "{}:{}".format(host, port)
+            vars(service_config).update(IS_HOSTED_REMOTELY=False)
+        os.environ.update(HTTP_SERVICE_HOST=host, HTTP_SERVICE_PORT=str(port),
+                          HTTP_SERVICE_SOCKADDR="{}:{}".format(host, port))
 
         # Construct SDK, using specified/configured API server hostname/instance.
         return api_client.configure(host=host, instance=api_client)
@@ -178,16 +212,17 @@ class APIClient(GeneratedAPIClient, metaclass=APIClientMeta):
         """
         if not instance:
             instance = cls
+        config = cls.ServiceConfig
 
         # Determine whether this client vs. server and is running on a local workstation or a "remote" server.
         is_server = os.getenv('SwaggerAPI')
-        is_hosted_remotely = os.getenv('IS_HOSTED_REMOTELY', cls.ServiceConfig.IS_HOSTED_REMOTELY)
+        is_hosted_remotely = os.getenv('IS_HOSTED_REMOTELY', config.IS_HOSTED_REMOTELY)
         if isinstance(is_hosted_remotely, str):
             is_hosted_remotely = is_hosted_remotely.lower() not in ('0', 'false')
-        cls.ServiceConfig.IS_HOSTED_REMOTELY = bool(is_hosted_remotely)
+        updates = dict(IS_HOSTED_REMOTELY=bool(is_hosted_remotely))  # (resolved configuration, prior to overrides)
 
         # Determine the remote server and client hostname, as possible.
-        environ = os.environ.copy()
+        environ = ChainMap({}, os.environ)  # (overrides atop environment)
         port = os.getenv('HTTP_SERVICE_PORT', '')
         if is_hosted_remotely:
             host = os.getenv('HTTP_SERVICE_HOST')
@@ -199,15 +234,17 @@ class APIClient(GeneratedAPIClient, metaclass=APIClientMeta):
                         environ['HTTP_SERVICE_HOST'] = host
                         environ['HTTP_SERVICE_SOCKADDR'] = ':'.join((host, port))
             if not is_hosted_remotely or not is_server:
-                host = host or cls.ServiceConfig.FLASK_HOST
-                cls.ServiceConfig.HTTP_SERVICE_HOST = cls.resolve_hostname()
+                host = host or config.FLASK_HOST
+                updates['HTTP_SERVICE_HOST'] = cls.resolve_hostname()
+        vars(config).update(updates)
 
         # Apply configuration overrides to module client configuration.
-        cls.ServiceConfig = apply_environ(cls.ServiceConfig, environ=environ)
-        cls.ServiceConfig.IS_HOSTED_REMOTELY = is_hosted_remotely
+        config = cls.ServiceConfig = apply_environ(config, environ=environ)
+        updates = dict(IS_HOSTED_REMOTELY=is_hosted_remotely)
         flask_port = os.getenv('FLASK_PORT')
         if flask_port:
-            cls.ServiceConfig.FLASK_PORT = int(flask_port)
+            updates['FLASK_PORT'] = int(flask_port)
+        vars(config).update(updates)
 
         # Also apply overrides to existing instance, if specified.
         if hasattr(instance, 'configuration'):
@@ -215,7 +252,7 @@ class APIClient(GeneratedAPIClient, metaclass=APIClientMeta):
 
         # Write back all configuration parameters to environment, if specified.
         if update_env:
-            update_environ(cls.ServiceConfig)
+            update_environ(config)
 
         return host
 
@@ -230,12 +267,32 @@ class APIClient(GeneratedAPIClient, metaclass=APIClientMeta):
         :return: Full base URL of endpoint, sans params
         :rtype:  str
         """
-        host = os.getenv('HTTP_SERVICE_HOST', '') or cls.ServiceConfig.FLASK_HOST
-        if host == cls.ServiceConfig.FLASK_HOST:
-            sockaddr = ':'.join((host, str(cls.ServiceConfig.FLASK_PORT)))
+        config = cls.ServiceConfig  # (read live: configuration may be altered after configure(), e.g. instance ports)
+        flask_host = config.FLASK_HOST
+        host = os.getenv('HTTP_SERVICE_HOST', '') or flask_host
+        if host == flask_host:
+            sockaddr = ':'.join((host, str(config.FLASK_PORT)))
         else:
-            sockaddr = cls.ServiceConfig.HTTP_SERVICE_SOCKADDR
-        url = cls.BASE_URL_FMT.format(sockaddr)
+            sockaddr = config.HTTP_SERVICE_SOCKADDR
+        return cls.compose_url(cls.BASE_URL_FMT, sockaddr, path)
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def compose_url(base_url_fmt, sockaddr, path=''):
+        """
+        Composes the full URL for an endpoint at a specific API service socket address (memoized).
+
+        :param base_url_fmt: Format for base URL, given socket address
+        :type  base_url_fmt: str
+        :param sockaddr:     API service socket address (host:port)
+        :type  sockaddr:     str
+        :param path:         Path to endpoint (empty => base URL)
+        :type  path:         str
+
+        :return: Full base URL of endpoint, sans params
+        :rtype:  str
+        """
+        url = base_url_fmt.format(sockaddr)
         if path:
             url = '/'.join((url, path))
         return url
@@ -258,8 +315,17 @@ class APIClient(GeneratedAPIClient, metaclass=APIClientMeta):
 
     @classmethod
     def resolve_hostname(cls):
-        """ Resolves the specific local hostname however possible, resorting to 'localhost' if all else fails. """
+        """
+        Resolves the specific local hostname however possible, resorting to 'localhost' if all else fails.
+
+        .. note::
+         * The hostname is resolved once, and re-resolved only if the configured Flask host or shell prompt changes
+           (reset `_hostname` to force re-resolution).
+        """
         host = getattr(cls.ServiceConfig, 'FLASK_HOST', 'localhost')
+        context = (host, os.getenv('PS1', ''))
+        if cls._hostname and cls._hostname[0] == context:
+            return cls._hostname[1]
 
         # Determine if client is running locally on a "remote" server machine, or as a remote client.
         try:
@@ -270,10 +336,11 @@ class APIClient(GeneratedAPIClient, metaclass=APIClientMeta):
         # If specific client host cannot be determined any other way, try to extract name from the shell prompt.
         if host in ('localhost', '0.0.0.0'):
             try:
-                host = re.fullmatch(r".*@(.*):.*", os.getenv('PS1', ''))[1]
+                host = PS1_HOST_PATT.fullmatch(context[1])[1]
             except (Exception, BaseException):
                 host = get_ipaddr()
 
+        cls._hostname = (context, host)
         return host
 
     def __del__(self):
@@ -287,17 +354,48 @@ class APIClient(GeneratedAPIClient, metaclass=APIClientMeta):
 # Instantiate the generic Skeleton API client SDK.
 APIClient.Singleton = APIClient()
 
-# ----- Instantiate client API for each Controller resource group:
+# ----- Client API for each Controller resource group (instantiated on first access):
 sdk = getattr(sdk, 'skeleton', sdk)  # (adjust for redefinition of 'sdk' symbol)
-try:
-    # noinspection PyUnresolvedReferences
-    APIClient.Singleton.manager_api = manager_api = sdk.ManagerApi(APIClient.Singleton)
-    # noinspection PyUnresolvedReferences
-    APIClient.Singleton.operations_api = operations_api = sdk.OperationsApi(APIClient.Singleton)
-except (Exception, BaseException):
-    # noinspection PyUnresolvedReferences
-    APIClient.Singleton.services_api = services_api = sdk.ServicesApi(APIClient.Singleton)
+CONTROLLER_APIS = dict(manager_api='ManagerApi', operations_api='OperationsApi', services_api='ServicesApi')
+
+
+def controller_api(name):
+    """
+    Retrieves the client API object for a Controller resource group, instantiating it on first access.
+
+    :param name: Name of client API object (see `CONTROLLER_APIS`)
+    :type  name: str
+
+    :return: Client API object, also bound as a module attribute and to the `APIClient` singleton
+    :rtype:  object
+
+    :raises AttributeError: if the SDK does not define the client API for the resource group
+    """
+    api = globals().get(name)
+    if api is None:
+        api = getattr(sdk, CONTROLLER_APIS[name])(APIClient.Singleton)
+        setattr(APIClient.Singleton, name, api)
+        globals()[name] = api
+    return api
+
+
+def __getattr__(name):
+    """ Module attribute fallback (PEP 562): Resolves client API objects on first access. """
+    if name in CONTROLLER_APIS:
+        try:
+            return controller_api(name)
+        except (Exception, BaseException) as exc:
+            raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name)) from exc
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    """ Module attribute listing (PEP 562): Includes client API objects not yet instantiated. """
+    return sorted(set(globals()) | set(CONTROLLER_APIS))
 
 
 # Purge client SDK tree from sys.path to avoid conflict with other Swagger SDKs.
-sys.path.pop(sys.path.index(str(EXT_DIR)))
+if sys.path and sys.path[0] == str(EXT_DIR):  # (as prepended, barring any intervening sys.path alteration)
+    del sys.path[0]
+else:
+    sys.path.remove(str(EXT_DIR))
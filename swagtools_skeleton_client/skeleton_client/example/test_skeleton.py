@@ -5,6 +5,7 @@
 import sys
 import os
 from pathlib import Path
+from functools import partial
 # noinspection PyPackageRequirements
 import urllib3.exceptions
 
@@ -29,6 +30,15 @@ SERVICE_HOST = os.getenv('HTTP_SERVICE_HOST',  # Host where Swagger API server i
                          'localhost')          # ('localhost' => use server running on local system)
 SERVICE_PASSWORD = 'vewwy-secwet'
 
+
+def fetch_all(**requests):
+    """ Issues independent API requests concurrently, returning their results (by name) once all have completed. """
+    pending = {name: request(async_req=True) for name, request in requests.items()}
+    # (any async result, whether from `multiprocessing` or `concurrent.futures` SDK pool, is resolved by its get())
+    return {name: result.get() if callable(getattr(result, 'get', None)) and not isinstance(result, dict) else result
+            for name, result in pending.items()}
+
+
 host = APIClient.init_sdk(host=SERVICE_HOST)
 try:
     is_remote = manager_api.is_hosted_remotely()
@@ -37,22 +47,29 @@ except (SkeletonSDKException, urllib3.exceptions.MaxRetryError) as exc:
 print("Host: {} (hosted {})".format(host, ("locally", "remotely")[bool(is_remote)]))
 
 try:
-    print("Service state: {}".format(operations_api.get_service_state()))
-    operations_api.set_service_state("STARTED")
-    print("Service state: {}".format(operations_api.get_service_state()))
-
+    # (Independent reads are issued concurrently; mutations, and the reads that depend upon them, in sequence.)
     config_item = 'HTTP_SERVICE_PORT'
-    print("Service config: {}".format(operations_api.get_service_config()))
-    print("Service config item: {}".format(operations_api.get_service_config(key=config_item)))  # (pass-by-keyword)
+    before = fetch_all(state=operations_api.get_service_state, config=operations_api.get_service_config,
+                       config_item=partial(operations_api.get_service_config, key=config_item),  # (pass-by-keyword)
+                       blob=operations_api.get_stored_blob)
+    operations_api.set_service_state("STARTED")
     operations_api.set_service_config(config_item, value=9999)
-    print("Service config item: {}".format(operations_api.get_service_config(key=config_item)))
+    after = fetch_all(state=operations_api.get_service_state,
+                      config_item=partial(operations_api.get_service_config, key=config_item))
+
+    print("Service state: {}".format(before['state']))
+    print("Service state: {}".format(after['state']))
+    print("Service config: {}".format(before['config']))
+    print("Service config item: {}".format(before['config_item']))
+    print("Service config item: {}".format(after['config_item']))
 
-    print("Service BLOB: {}".format(operations_api.get_stored_blob()))
+    print("Service BLOB: {}".format(before['blob']))
     manager_api.do_authorize(password=SERVICE_PASSWORD)
     the_blob = dict(blob_string1="the BLOB string", blob_int1=42, blob_flag=True, blob_const="immutable")
     operations_api.do_store_blob(the_blob)
-    print("Service BLOB: {}".format(operations_api.get_stored_blob()))
-    print("Service BLOB client: {}".format(operations_api.get_blob_client()))
+    stored = fetch_all(blob=operations_api.get_stored_blob, blob_client=operations_api.get_blob_client)
+    print("Service BLOB: {}".format(stored['blob']))
+    print("Service BLOB client: {}".format(stored['blob_client']))
     try:
         operations_api.do_store_blob(the_blob)
     except SkeletonSDKException as exc:
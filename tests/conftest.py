@@ -0,0 +1,18 @@
+""" Common fixtures for Swagger Tools tests. """
+# pylint:disable=redefined-outer-name
+import pytest
+from flask import Flask
+
+from swagtools.swagger_base import SwaggerAPI
+
+
+@pytest.fixture
+def app():
+    """ Bare Flask application. """
+    return Flask(__name__)
+
+
+@pytest.fixture
+def api(app):
+    """ Swagger API attached to a bare Flask application. """
+    return SwaggerAPI(app=app)
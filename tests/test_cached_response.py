@@ -0,0 +1,78 @@
+""" Tests for opt-in response caching of request handlers. """
+# pylint:disable=redefined-outer-name
+from functools import wraps
+
+import pytest
+from flask import request
+
+from swagtools.swagger_base import SwaggerResource
+
+
+class DictCache:
+    """ Minimal in-memory cache providing a Flask-Caching compatible `cached()` decorator factory. """
+    def __init__(self):
+        self.store = {}
+
+    def cached(self, timeout=None, query_string=False):  # pylint:disable=unused-argument
+        """ Caches handler results per request path (and query string, if specified). """
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                key = request.full_path if query_string else request.path
+                if key not in self.store:
+                    self.store[key] = func(*args, **kwargs)
+                return self.store[key]
+            return wrapper
+        return decorator
+
+
+@pytest.fixture
+def handler():
+    """ Cached request handler that returns a distinct result for every invocation. """
+    calls = []
+
+    @SwaggerResource.cached_response(timeout=60)
+    def get_thing():
+        calls.append(request.full_path)
+        return dict(call=len(calls))
+    return get_thing
+
+
+def _get(app, handler, path, method='GET'):
+    with app.test_request_context(path, method=method):
+        return handler()
+
+
+def test_uncached_without_cache(app, handler, monkeypatch):
+    monkeypatch.setattr(SwaggerResource, 'cache', None)
+    assert _get(app, handler, '/thing') == dict(call=1)
+    assert _get(app, handler, '/thing') == dict(call=2)
+
+
+def test_cached_get_returns_stored_response(app, handler, monkeypatch):
+    monkeypatch.setattr(SwaggerResource, 'cache', DictCache())
+    assert _get(app, handler, '/thing?a=1') == dict(call=1)
+    assert _get(app, handler, '/thing?a=1') == dict(call=1)
+
+
+def test_query_string_variation_misses_cache(app, handler, monkeypatch):
+    monkeypatch.setattr(SwaggerResource, 'cache', DictCache())
+    assert _get(app, handler, '/thing?a=1') == dict(call=1)
+    assert _get(app, handler, '/thing?a=2') == dict(call=2)
+    assert _get(app, handler, '/thing?a=1') == dict(call=1)
+
+
+def test_non_get_requests_uncached(app, handler, monkeypatch):
+    monkeypatch.setattr(SwaggerResource, 'cache', DictCache())
+    assert _get(app, handler, '/thing', method='POST') == dict(call=1)
+    assert _get(app, handler, '/thing', method='POST') == dict(call=2)
+
+
+def test_rebound_to_replacement_cache(app, handler, monkeypatch):
+    monkeypatch.setattr(SwaggerResource, 'cache', DictCache())
+    assert _get(app, handler, '/thing') == dict(call=1)
+    replacement = DictCache()
+    monkeypatch.setattr(SwaggerResource, 'cache', replacement)
+    assert _get(app, handler, '/thing') == dict(call=2)
+    assert _get(app, handler, '/thing') == dict(call=2)
+    assert list(replacement.store.values()) == [dict(call=2)]
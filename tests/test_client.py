@@ -0,0 +1,60 @@
+""" Tests for the skeleton API client configuration. """
+# pylint:disable=redefined-outer-name
+from types import SimpleNamespace
+from pathlib import Path
+
+import pytest
+
+from swagtools_skeleton_client.skeleton_client import client
+from swagtools_skeleton_client.skeleton_client.client import APIClient
+
+
+@pytest.fixture
+def no_config_load(monkeypatch):
+    """ Fails any (re)loading of the service configuration file. """
+    def fail(*_, **__):
+        raise AssertionError("service configuration reloaded")
+    monkeypatch.setattr(client, 'import_module_source', fail)
+
+
+def test_configuration_accessible_from_instances():
+    assert APIClient.ServiceConfig is not None
+    assert APIClient.Singleton.ServiceConfig is APIClient.ServiceConfig
+    assert APIClient.Singleton.BASE_URL_FMT == APIClient.BASE_URL_FMT
+    assert APIClient.BASE_URL_FMT.format('host:1') == \
+        "http://host:1" + APIClient.ServiceConfig.API_BASEPATH + APIClient.ServiceConfig.VERSION
+
+
+def test_subclass_inherits_resolved_configuration(no_config_load):  # pylint:disable=unused-argument
+    class Subclient(APIClient):  # pylint:disable=too-few-public-methods
+        """ Specialized client. """
+    assert Subclient.ServiceConfig is APIClient.ServiceConfig
+    assert Subclient.BASE_URL_FMT == APIClient.BASE_URL_FMT
+
+
+def test_configuration_override_retained(monkeypatch, no_config_load):  # pylint:disable=unused-argument
+    custom = SimpleNamespace(**vars(APIClient.ServiceConfig))
+    custom.FLASK_HOST, custom.FLASK_PORT = 'custom.example', 4321
+    monkeypatch.setattr(APIClient, 'ServiceConfig', custom)
+    monkeypatch.delenv('HTTP_SERVICE_HOST', raising=False)
+
+    class Subclient(APIClient):  # pylint:disable=too-few-public-methods
+        """ Specialized client, defined after configuration override. """
+    assert APIClient.ServiceConfig is custom
+    assert APIClient.Singleton.ServiceConfig is custom
+    assert Subclient.ServiceConfig is custom
+    assert APIClient.url('things') == APIClient.BASE_URL_FMT.format('custom.example:4321') + '/things'
+    assert APIClient.get_service_config()['FLASK_HOST'] == 'custom.example'
+
+
+@pytest.mark.parametrize('relpath, expected', [('sdk/__init__.py', True), ('sdk/models/__init__.py', True),
+                                               ('../ext2/sdk/__init__.py', False),
+                                               ('../ext_old/sdk/__init__.py', False)])
+def test_is_ext_module(relpath, expected):
+    module = SimpleNamespace(__file__=str(Path(client.EXT_DIR, relpath)))
+    assert client.is_ext_module(module) is expected
+
+
+def test_is_ext_module_without_file():
+    assert not client.is_ext_module(None)
+    assert not client.is_ext_module(SimpleNamespace(__file__=None))
@@ -0,0 +1,144 @@
+""" Tests for JSON sanitization and decoding: results must not depend upon whether `orjson` is installed. """
+# pylint:disable=too-few-public-methods
+import datetime
+import enum
+import json
+import math
+
+import pytest
+
+from swagtools import swagger_base
+from swagtools.swagger_base import (SwaggerResource, json_loads, json_str_to_dict)
+
+
+class Color(enum.Enum):
+    """ Pure enumeration. """
+    RED = 'red'
+
+
+class Level(enum.IntEnum):
+    """ Integer enumeration. """
+    HIGH = 3
+
+
+class Point:
+    """ Object represented via its attributes. """
+    def __init__(self, x, y):
+        self.x, self.y = x, y
+
+
+class Stamp:
+    """ Object represented via a custom encoder. """
+    @staticmethod
+    def __encoder__(item):
+        return f"stamp:{id(item) > 0}"
+
+
+SANITIZE_PAYLOADS = [
+    dict(name="widget", count=3, ratio=0.5, flags=(True, False, None)),
+    dict(color=Color.RED, level=Level.HIGH),
+    dict(nan=math.nan, inf=math.inf, ninf=-math.inf),
+    {1: 'one', 2.5: 'two and a half', None: 'none', False: 'false'},
+    dict(when=datetime.datetime(2020, 1, 2, 3, 4, 5), day=datetime.date(2020, 1, 2)),
+    dict(point=Point(1, [2, Point(3, 4)]), stamp=Stamp()),
+    [Point(0, 0), (1, 2), "text"],
+]
+
+DECODE_PAYLOADS = ['{"a": 1, "b": [1.5, "x", null, true]}', '{"n": NaN, "i": Infinity}', '{"dup": 1, "dup": 2}',
+                   '{"big": 123456789012345678901234567890, "small": -123456789012345678901234567890}',
+                   '{"long": 1.2345678901234567890123, "edge": 18446744073709551616}', '[1, 2]', '"text"',
+                   '{"s": "\\ud800"}']
+# (dictionary representations equally valid as JSON or Python syntax, plus Python-only syntax)
+DICT_PAYLOADS = ['{"a": 1, "b": [1.5, "x"]}', '{"big": 123456789012345678901234567890}', '  {"a": {"b": 2}}',
+                 "{'a': 1}"]
+
+
+def _without_orjson(monkeypatch, func, *args, **kwargs):
+    """ Invokes a function as if `orjson` were not installed. """
+    with monkeypatch.context() as patch:
+        patch.setattr(swagger_base, 'orjson', None)
+        return func(*args, **kwargs)
+
+
+def _same(value1, value2):
+    """ Compares JSON-like values, treating NaN as equal to itself. """
+    return json.dumps(value1, sort_keys=True) == json.dumps(value2, sort_keys=True)
+
+
+@pytest.mark.parametrize('as_json', [False, True])
+@pytest.mark.parametrize('payload', SANITIZE_PAYLOADS)
+def test_sanitize_independent_of_orjson(monkeypatch, payload, as_json):
+    result = SwaggerResource.sanitize_for_json(payload, as_json=as_json)
+    assert _same(result, _without_orjson(monkeypatch, SwaggerResource.sanitize_for_json, payload, as_json=as_json))
+
+
+@pytest.mark.parametrize('payload', SANITIZE_PAYLOADS)
+def test_sanitize_equivalent_to_json_round_trip(payload):
+    expected = json.loads(SwaggerResource.sanitize_for_json(payload, as_json=True))
+    assert _same(SwaggerResource.sanitize_for_json(payload), expected)
+
+
+def test_sanitize_represents_int_enums_by_value():
+    assert SwaggerResource.sanitize_for_json(dict(level=Level.HIGH)) == dict(level=3)
+
+
+@pytest.mark.parametrize('payload', DECODE_PAYLOADS)
+def test_json_loads_independent_of_orjson(monkeypatch, payload):
+    for data in (payload, payload.encode('utf-8', errors='surrogatepass')):
+        assert _same(json_loads(data), _without_orjson(monkeypatch, json_loads, data))
+
+
+@pytest.mark.parametrize('payload', DICT_PAYLOADS)
+def test_json_str_to_dict_independent_of_orjson(monkeypatch, payload):
+    assert _same(json_str_to_dict(payload), _without_orjson(monkeypatch, json_str_to_dict, payload))
+
+
+class Plain:
+    """ Object whose instances may carry their own custom encoder. """
+    def __init__(self, value):
+        self.value = value
+
+
+class Slotted:
+    """ Object without an attribute dictionary. """
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __str__(self):
+        return f"Slotted({self.value})"
+
+
+class SlottedWithDict(Slotted):
+    """ Object with both slots and an attribute dictionary. """
+    __slots__ = ('__dict__',)
+
+
+class Dynamic:
+    """ Object resolving attributes dynamically. """
+    def __getattr__(self, name):
+        if name == '__encoder__':
+            return lambda item: "dynamic"
+        raise AttributeError(name)
+
+
+@pytest.mark.parametrize('encoded_first', [False, True])
+def test_sanitize_instance_encoder_independent_of_instance_order(encoded_first):
+    plain, encoded = Plain(1), Plain(2)
+    encoded.__encoder__ = lambda item: f"encoded:{item.value}"
+    items = [encoded, plain] if encoded_first else [plain, encoded]
+    result = SwaggerResource.sanitize_for_json(dict(items=items))['items']
+    expected = ["encoded:2", dict(value=1)]
+    assert result == (expected if encoded_first else expected[::-1])
+
+
+def test_sanitize_slots_and_dict():
+    mixed = SlottedWithDict(1)
+    mixed.extra = 2
+    assert SwaggerResource.sanitize_for_json(dict(mixed=mixed, slotted=Slotted(3))) == \
+        dict(mixed=dict(extra=2), slotted="Slotted(3)")
+
+
+def test_sanitize_dynamic_attributes():
+    assert SwaggerResource.sanitize_for_json(dict(dynamic=Dynamic())) == dict(dynamic="dynamic")
@@ -0,0 +1,57 @@
+""" Tests for Swagger API JSON response serialization. """
+# pylint:disable=redefined-outer-name
+import json
+import math
+
+import pytest
+from flask import Flask
+from flask_restx import (Api, Resource)
+from flask_restx.representations import output_json
+
+from swagtools.swagger_base import (SwaggerAPI, orjson)
+
+PAYLOADS = [
+    dict(name="widget", count=3, ratio=0.25, flags=[True, False, None], nested=dict(items=[1, 2.5, "three"])),
+    dict(text="näive ☃", empty={}, blank=[]),
+    dict(nan=math.nan, inf=math.inf, ninf=-math.inf),
+    [1, "two", 3.0],
+    "plain string",
+    None,
+]
+
+
+def _client(api_class, payload, debug):
+    """ Test client (and API) for an application serving a payload from an endpoint via an API of specified class. """
+    app = Flask(__name__)
+    app.debug = debug
+    api = api_class(app=app)
+
+    @api.route('/payload')
+    class PayloadResource(Resource):  # pylint:disable=unused-variable
+        """ Serves the payload. """
+        def get(self):  # pylint:disable=missing-function-docstring
+            return payload
+
+    return app.test_client(), api
+
+
+@pytest.mark.parametrize('debug', [False, True])
+@pytest.mark.parametrize('payload', PAYLOADS)
+def test_response_body_matches_stock(payload, debug):
+    stock = _client(Api, payload, debug)[0].get('/payload')
+    swagger = _client(SwaggerAPI, payload, debug)[0].get('/payload')
+    assert swagger.status_code == stock.status_code == 200
+    assert swagger.get_data() == stock.get_data()
+
+
+@pytest.mark.parametrize('debug', [False, True])
+def test_schema_served_from_cache(debug):
+    client, api = _client(SwaggerAPI, {}, debug)
+    body = client.get('/swagger.json').get_data()
+    assert client.get('/swagger.json').get_data() == body
+    with client.application.test_request_context():
+        schema = api.__schema__
+        stock = output_json(schema, 200).get_data()
+        assert json.loads(body) == json.loads(stock) == schema
+        if debug or orjson is None:  # (otherwise, compact form)
+            assert body == stock
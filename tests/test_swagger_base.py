@@ -0,0 +1,167 @@
+""" Tests for Swagger API base utilities: type resolution, field interning, argument plans, models, status codes. """
+# pylint:disable=redefined-outer-name,protected-access
+import typing
+from http import HTTPStatus
+
+import pytest
+from flask import request
+from flask_restx import (fields, reqparse)
+
+from swagtools import swagger_base
+from swagtools.swagger_base import (ArgPlan, HTTPStatus_from_code, SwaggerModel, SwaggerNamespace, SwaggerResource,
+                                    TypingJig)
+
+
+# ---- TypingJig.to_type() memoization
+
+def test_to_type_resolves_typing_spec():
+    assert TypingJig.to_type('List[int]') == typing.List[int]
+    assert TypingJig.to_type('list<int>') == TypingJig.to_type('list[int]')  # (legacy composite form)
+    assert TypingJig.to_type('not a type') is None
+
+
+def test_to_type_memo_bypassed_when_dependency_rebound():
+    assert TypingJig.to_type('List[int]') == typing.List[int]  # (memoized)
+    assert TypingJig.to_type('List[int]', List=typing.Set) == typing.Set[int]
+    assert TypingJig.to_type('List[int]', {**TypingJig.symbols(), 'int': str}) == typing.List[str]
+    assert TypingJig.to_type('List[int]') == typing.List[int]
+
+
+def test_to_type_memo_bounded(monkeypatch):
+    monkeypatch.setattr(swagger_base, '_TYPESPEC_CACHE_MAX', 2)
+    swagger_base._TYPESPEC_CACHE.clear()
+    for typespec in ('List[int]', 'List[str]', 'List[int]', 'List[float]'):
+        TypingJig.to_type(typespec)
+    assert list(swagger_base._TYPESPEC_CACHE) == ['List[int]', 'List[float]']  # (least recently used discarded)
+
+
+def test_to_type_not_memoized_for_namespace_symbols():
+    assert TypingJig.to_type('Thing', Thing=int) is int
+    assert TypingJig.to_type('Thing', Thing=str) is str
+    assert TypingJig.to_type('Thing') is None
+
+
+def test_symbols_include_module_names():
+    namespace = TypingJig.symbols()
+    assert namespace is TypingJig.symbols()
+    assert namespace['List'] is typing.List and namespace['int'] is int
+    assert namespace['SwaggerRequestHandler'] is swagger_base.SwaggerRequestHandler  # (defined last in module)
+
+
+def test_symbols_per_api_include_model_types(api):
+    assert 'Sprocket' not in TypingJig.symbols(api)
+    SwaggerModel.define(api, 'Sprocket', dict(teeth=dict(type='int')))
+    namespace = TypingJig.symbols(api)
+    assert namespace['Sprocket'] is api.model_types['Sprocket']
+    assert 'Sprocket' not in TypingJig.symbols()
+
+
+# ---- TypingJig.field_instance() interning
+
+def test_field_instance_interns_identical_definitions():
+    field = TypingJig.field_instance(fields.String, description="interned", required=True)
+    assert TypingJig.field_instance(fields.String, required=True, description="interned") is field
+
+
+def test_field_instance_distinguishes_definitions():
+    field = TypingJig.field_instance(fields.String, description="interned", required=True)
+    assert TypingJig.field_instance(fields.String, description="other", required=True) is not field
+    assert TypingJig.field_instance(fields.Integer, description="interned", required=True) is not field
+    assert TypingJig.field_instance(fields.String, description="interned", required=1) is not field  # (1 == True)
+    assert TypingJig.field_instance(fields.String, description="interned") is not field
+
+
+def test_field_instance_unhashable_definitions_not_interned():
+    field = TypingJig.field_instance(fields.String, enum=['a', 'b'])
+    assert TypingJig.field_instance(fields.String, enum=['a', 'b']) is not field
+
+
+# ---- Argument processing plans
+
+def test_preprocess_args_unpacking_tracks_arg_plan():
+    """ preprocess_args() unpacks `ArgPlan` positionally: its unpacking targets must track the `ArgPlan` fields. """
+    local_names = SwaggerResource.preprocess_args.__func__.__code__.co_varnames  # (in order of first assignment)
+    start = local_names.index('argname')
+    targets = [name.lstrip('_') for name in local_names[start:start + len(ArgPlan._fields)]]
+    assert targets == ['arg' + ArgPlan._fields[0]] + list(ArgPlan._fields[1:])
+
+
+@pytest.fixture
+def model(api):
+    """ Simple model defined within API. """
+    return SwaggerModel.define(api, 'Widget', dict(name=dict(type='str')))
+
+
+@pytest.fixture
+def parser(model):
+    """ Request parser with a positional parameter and a model body parameter. """
+    parser = reqparse.RequestParser()
+    parser.add_argument('count', type=int, required=True, location='values')
+    parser.add_argument('widget', type=model, location='json')
+    return parser
+
+
+def test_parser_plan_consistent_with_arg_plan(parser):
+    plan = SwaggerResource.parser_plan(parser)
+    assert SwaggerResource.parser_plan(parser) is plan
+    assert SwaggerResource.arg_plan(parser) is plan.args
+    assert SwaggerResource.arg_plan(parser, models_only=True) is plan.model_args
+    assert [arg.name for arg in plan.args] == ['count', 'widget']
+    assert [arg.name for arg in plan.model_args] == ['widget']
+    assert plan.positional == ('count',)
+    assert plan.json_fixup
+    unparsed = SwaggerResource.arg_plan(parser.args)  # (argument collection: model value classes created anew)
+    assert [arg[:-1] for arg in unparsed] == [arg[:-1] for arg in plan.args]
+
+
+def test_parser_plan_recomputed_when_args_added(parser):
+    plan = SwaggerResource.parser_plan(parser)
+    parser.add_argument('extra', type=str, location='values')
+    replan = SwaggerResource.parser_plan(parser)
+    assert replan is not plan
+    assert [arg.name for arg in replan.args] == ['count', 'widget', 'extra']
+
+
+def test_preprocess_args_relocates_model_body(app, parser):
+    with app.test_request_context('/?count=3', json=dict(name="gizmo")):
+        SwaggerResource.preprocess_args(request, parser, strict=True)
+        assert request.args == dict(count='3', widget=dict(name="gizmo"))
+        assert parser.args[1].location == 'values'  # (until reinstated after parsing)
+
+
+# ---- SwaggerModel.lookup() caching
+
+def test_model_lookup_invalidated_by_define(api):
+    assert SwaggerModel.lookup(api, 'Gadget') is None  # (absence cached)
+    model = SwaggerModel.define(api, 'Gadget', dict(size=dict(type='int')))
+    assert api.model_lookup_cache is None
+    assert SwaggerModel.lookup(api, 'Gadget') is model
+    assert TypingJig.to_type('Gadget', TypingJig.symbols(api)) is api.model_types['Gadget']
+
+
+def test_model_lookup_invalidated_by_direct_model_addition(api):
+    assert SwaggerModel.lookup(api, 'Doohickey') is None
+    model = api.model('Doohickey', dict(size=fields.Integer()))
+    assert SwaggerModel.lookup(api, 'Doohickey') is model
+
+
+# ---- HTTP status codes
+
+def _canonical_status_code_reference(code):
+    """ Reference (unmemoized) implementation of SwaggerNamespace.canonical_status_code(). """
+    try:
+        code = HTTPStatus(int(code))
+    except Exception:  # pylint:disable=broad-except
+        pass
+    return str(code).split('HTTPStatus.', maxsplit=1)[-1]
+
+
+@pytest.mark.parametrize('code', [200, 404, '200', '404', HTTPStatus.OK, HTTPStatus.NOT_FOUND, 'HTTPStatus.OK',
+                                  'OK', 'NOT_FOUND', 999, '999', 'custom status'])
+def test_canonical_status_code_equivalence(code):
+    assert SwaggerNamespace.canonical_status_code(code) == _canonical_status_code_reference(code)
+
+
+def test_status_from_code():
+    assert HTTPStatus_from_code(200) is HTTPStatus.OK
+    assert HTTPStatus_from_code(999) == 999